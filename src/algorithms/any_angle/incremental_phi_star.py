@@ -37,6 +37,15 @@ class IncrementalPhiStar(PathfindingAlgorithm):
         
         # Configuration
         self.epsilon = 2.5  # Suboptimality bound for faster replanning
+    
+    def reset(self):
+        """Discard the persistent search data so the next search plans from scratch."""
+        super().reset()
+        self.goal_node = None
+        self.open_set = []
+        self.open_set_dict = {}
+        self.closed_set = set()
+        self.inconsistent_nodes = set()
         
     def find_path(self, grid: DynamicGrid, start: Tuple[int, int], goal: Tuple[int, int]) -> PathfindingResult:
         """
@@ -157,7 +166,7 @@ class IncrementalPhiStar(PathfindingAlgorithm):
             if current_key < self._calculate_key(current_node, start_node):
                 # Key has been updated, re-insert
                 heapq.heappush(self.open_set, 
-                             (*self._calculate_key(current_node, start_node), id(current_node), current_node))
+                             (*self._calculate_key(current_node, start_node), next(self._counter), current_node))
                 self.open_set_dict[current_node] = current_key[0]
                 
             elif current_node.g_cost > current_node.rhs:
@@ -216,7 +225,7 @@ class IncrementalPhiStar(PathfindingAlgorithm):
         
         if not node.is_consistent():
             key = self._calculate_key(node, start_node)
-            heapq.heappush(self.open_set, (*key, id(node), node))
+            heapq.heappush(self.open_set, (*key, next(self._counter), node))
             self.open_set_dict[node] = key[0]
     
     def _calculate_key(self, node: DynamicNode, start_node: DynamicNode) -> Tuple[float, float]:
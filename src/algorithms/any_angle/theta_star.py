@@ -61,6 +61,8 @@ class ThetaStar(PathfindingAlgorithm):
         if start_node == goal_node:
             return self._create_result([start], True)
         
+        self._init_search(grid, goal_node, self.heuristic_type)
+        
         # Initialize Theta*
         open_set = []
         closed_set = set()
@@ -72,7 +74,7 @@ class ThetaStar(PathfindingAlgorithm):
         start_node.parent = None
         start_node.set_parent_coordinates(float(start_node.x), float(start_node.y))
         
-        heapq.heappush(open_set, (start_node.f_cost, id(start_node), start_node))
+        heapq.heappush(open_set, (start_node.f_cost, next(self._counter), start_node))
         open_set_dict = {start_node: start_node.f_cost}
         
         while open_set:
@@ -121,7 +123,7 @@ class ThetaStar(PathfindingAlgorithm):
                             neighbor.f_cost = neighbor.g_cost + neighbor.h_cost
                             
                             if neighbor not in open_set_dict:
-                                heapq.heappush(open_set, (neighbor.f_cost, id(neighbor), neighbor))
+                                heapq.heappush(open_set, (neighbor.f_cost, next(self._counter), neighbor))
                             open_set_dict[neighbor] = neighbor.f_cost
                         
                         continue
@@ -137,7 +139,7 @@ class ThetaStar(PathfindingAlgorithm):
                     neighbor.f_cost = neighbor.g_cost + neighbor.h_cost
                     
                     if neighbor not in open_set_dict:
-                        heapq.heappush(open_set, (neighbor.f_cost, id(neighbor), neighbor))
+                        heapq.heappush(open_set, (neighbor.f_cost, next(self._counter), neighbor))
                     open_set_dict[neighbor] = neighbor.f_cost
         
         return self._create_result([], False, "No path exists")
@@ -162,7 +164,8 @@ class ThetaStar(PathfindingAlgorithm):
             
             current = current.parent
         
-        return list(reversed(path))
+        path.reverse()
+        return path
 
 
 class BasicThetaStar(ThetaStar):
@@ -223,6 +226,8 @@ class LazyThetaStar(PathfindingAlgorithm):
         if start_node == goal_node:
             return self._create_result([start], True)
         
+        self._init_search(grid, goal_node, self.heuristic_type)
+        
         # Initialize Lazy Theta*
         open_set = []
         closed_set = set()
@@ -232,7 +237,7 @@ class LazyThetaStar(PathfindingAlgorithm):
         start_node.f_cost = start_node.g_cost + start_node.h_cost
         start_node.set_parent_coordinates(float(start_node.x), float(start_node.y))
         
-        heapq.heappush(open_set, (start_node.f_cost, id(start_node), start_node))
+        heapq.heappush(open_set, (start_node.f_cost, next(self._counter), start_node))
         open_set_dict = {start_node: start_node.f_cost}
         
         while open_set:
@@ -282,7 +287,7 @@ class LazyThetaStar(PathfindingAlgorithm):
                     neighbor.f_cost = neighbor.g_cost + neighbor.h_cost
                     
                     if neighbor not in open_set_dict:
-                        heapq.heappush(open_set, (neighbor.f_cost, id(neighbor), neighbor))
+                        heapq.heappush(open_set, (neighbor.f_cost, next(self._counter), neighbor))
                     open_set_dict[neighbor] = neighbor.f_cost
         
         return self._create_result([], False, "No path exists")
@@ -320,4 +325,5 @@ class LazyThetaStar(PathfindingAlgorithm):
             
             current = current.parent
         
-        return list(reversed(path))
\ No newline at end of file
+        path.reverse()
+        return path
\ No newline at end of file
@@ -62,6 +62,8 @@ class AStar(PathfindingAlgorithm):
         if start_node == goal_node:
             return self._create_result([start], True)
         
+        self._init_search(grid, goal_node, self.heuristic_type)
+        
         # Initialize pathfinding
         open_set = []
         closed_set = set()
@@ -72,7 +74,7 @@ class AStar(PathfindingAlgorithm):
         start_node.f_cost = start_node.g_cost + self.heuristic_weight * start_node.h_cost
         start_node.in_open_set = True
         
-        heapq.heappush(open_set, (start_node.f_cost, id(start_node), start_node))
+        heapq.heappush(open_set, (start_node.f_cost, next(self._counter), start_node))
         
         # Main A* loop
         while open_set:
@@ -121,7 +123,7 @@ class AStar(PathfindingAlgorithm):
                     neighbor.f_cost = neighbor.g_cost + self.heuristic_weight * neighbor.h_cost
                     
                     # Add to open set
-                    heapq.heappush(open_set, (neighbor.f_cost, id(neighbor), neighbor))
+                    heapq.heappush(open_set, (neighbor.f_cost, next(self._counter), neighbor))
         
         # No path found
         return self._create_result([], False, "No path exists")
@@ -184,6 +186,8 @@ class BidirectionalAStar(PathfindingAlgorithm):
         if start_node == goal_node:
             return self._create_result([start], True)
         
+        self._init_search(grid, goal_node, self.heuristic_type)
+        
         # Initialize both searches
         forward_open = []
         forward_closed = set()
@@ -198,13 +202,13 @@ class BidirectionalAStar(PathfindingAlgorithm):
         start_node.g_cost = 0.0
         start_node.h_cost = self.get_heuristic(start_node, goal_node, self.heuristic_type)
         start_node.f_cost = start_node.g_cost + start_node.h_cost
-        heapq.heappush(forward_open, (start_node.f_cost, 'forward', id(start_node), start_node))
+        heapq.heappush(forward_open, (start_node.f_cost, 'forward', next(self._counter), start_node))
         
         # Initialize goal node for backward search
         goal_node.g_cost = 0.0
         goal_node.h_cost = self.get_heuristic(goal_node, start_node, self.heuristic_type)
         goal_node.f_cost = goal_node.g_cost + goal_node.h_cost
-        heapq.heappush(backward_open, (goal_node.f_cost, 'backward', id(goal_node), goal_node))
+        heapq.heappush(backward_open, (goal_node.f_cost, 'backward', next(self._counter), goal_node))
         
         meeting_point = None
         best_cost = float('inf')
@@ -242,7 +246,7 @@ class BidirectionalAStar(PathfindingAlgorithm):
                         neighbor.f_cost = neighbor.g_cost + neighbor.h_cost
                         
                         forward_nodes.add(neighbor)
-                        heapq.heappush(forward_open, (neighbor.f_cost, 'forward', id(neighbor), neighbor))
+                        heapq.heappush(forward_open, (neighbor.f_cost, 'forward', next(self._counter), neighbor))
             
             elif backward_open:
                 # Backward search step
@@ -272,7 +276,7 @@ class BidirectionalAStar(PathfindingAlgorithm):
                         neighbor.f_cost = neighbor.g_cost + neighbor.h_cost
                         
                         backward_nodes.add(neighbor)
-                        heapq.heappush(backward_open, (neighbor.f_cost, 'backward', id(neighbor), neighbor))
+                        heapq.heappush(backward_open, (neighbor.f_cost, 'backward', next(self._counter), neighbor))
         
         if meeting_point:
             # Reconstruct bidirectional path
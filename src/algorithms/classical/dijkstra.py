@@ -64,7 +64,7 @@ class Dijkstra(PathfindingAlgorithm):
         start_node.g_cost = 0.0
         start_node.f_cost = 0.0  # In Dijkstra, f_cost = g_cost (no heuristic)
         
-        heapq.heappush(open_set, (start_node.g_cost, id(start_node), start_node))
+        heapq.heappush(open_set, (start_node.g_cost, next(self._counter), start_node))
         
         # Main Dijkstra loop
         while open_set:
@@ -107,7 +107,7 @@ class Dijkstra(PathfindingAlgorithm):
                     neighbor.parent = current_node
                     
                     # Add to priority queue
-                    heapq.heappush(open_set, (distance, id(neighbor), neighbor))
+                    heapq.heappush(open_set, (distance, next(self._counter), neighbor))
         
         # No path found
         return self._create_result([], False, "No path exists")
@@ -177,7 +177,7 @@ class DijkstraAllPaths(PathfindingAlgorithm):
         
         # Initialize start node
         start_node.g_cost = 0.0
-        heapq.heappush(open_set, (0.0, id(start_node), start_node))
+        heapq.heappush(open_set, (0.0, next(self._counter), start_node))
         
         while open_set:
             self._increment_iteration()
@@ -204,7 +204,7 @@ class DijkstraAllPaths(PathfindingAlgorithm):
                 if distance < neighbor.g_cost:
                     neighbor.g_cost = distance
                     neighbor.parent = current_node
-                    heapq.heappush(open_set, (distance, id(neighbor), neighbor))
+                    heapq.heappush(open_set, (distance, next(self._counter), neighbor))
         
         return distances
     
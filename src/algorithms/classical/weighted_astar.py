@@ -26,6 +26,12 @@ class WeightedAStar(PathfindingAlgorithm):
         self.visited_nodes = []
         self.open_nodes = []
     
+    def reset(self):
+        """Clear the exploration record of the last search in place."""
+        super().reset()
+        self.visited_nodes.clear()
+        self.open_nodes.clear()
+    
     def find_path(self, grid, start, goal):
         """
         Find path using Weighted A* algorithm.
@@ -34,6 +34,14 @@ class IDAStar(PathfindingAlgorithm):
         self.next_threshold: float = float('inf')
         self.solution_path: List[GridNode] = []
     
+    def reset(self):
+        """Clear search state left over from the last search."""
+        super().reset()
+        self.goal_node = None
+        self.current_threshold = 0.0
+        self.next_threshold = float('inf')
+        self.solution_path = []
+    
     def find_path(self, grid: Grid, start: Tuple[int, int], goal: Tuple[int, int]) -> PathfindingResult:
         """
         Find optimal path using IDA* algorithm.
@@ -63,6 +71,8 @@ class IDAStar(PathfindingAlgorithm):
         if start_node == goal_node:
             return self._create_result([start], True)
         
+        self._init_search(grid, goal_node, self.heuristic_type)
+        
         self.goal_node = goal_node
         self.solution_path = []
         
@@ -224,6 +234,8 @@ class RecursiveBestFirstSearch(PathfindingAlgorithm):
         if start_node == goal_node:
             return self._create_result([start], True)
         
+        self._init_search(grid, goal_node, self.heuristic_type)
+        
         self.goal_node = goal_node
         
         # Initialize start node
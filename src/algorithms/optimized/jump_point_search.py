@@ -71,6 +71,8 @@ class JumpPointSearch(PathfindingAlgorithm):
         if start_node == goal_node:
             return self._create_result([start], True)
         
+        self._init_search(grid, goal_node, self.heuristic_type)
+        
         # Initialize JPS
         open_set = []
         closed_set: Set[Tuple[int, int]] = set()
@@ -79,7 +81,7 @@ class JumpPointSearch(PathfindingAlgorithm):
         start_node.h_cost = self.get_heuristic(start_node, goal_node, self.heuristic_type)
         start_node.f_cost = start_node.g_cost + start_node.h_cost
         
-        heapq.heappush(open_set, (start_node.f_cost, id(start_node), start_node))
+        heapq.heappush(open_set, (start_node.f_cost, next(self._counter), start_node))
         
         jump_points_found = 0
         
@@ -133,7 +135,7 @@ class JumpPointSearch(PathfindingAlgorithm):
                             jump_node.h_cost = self.get_heuristic(jump_node, goal_node, self.heuristic_type)
                             jump_node.f_cost = jump_node.g_cost + jump_node.h_cost
                             
-                            heapq.heappush(open_set, (jump_node.f_cost, id(jump_node), jump_node))
+                            heapq.heappush(open_set, (jump_node.f_cost, next(self._counter), jump_node))
         
         return self._create_result([], False, "No path exists")
     
@@ -286,6 +288,11 @@ class JumpPointSearchPlus(JumpPointSearch):
         # Precomputed jump distances
         self.jump_distances: Optional[dict] = None
     
+    def reset(self):
+        """Clear search state, including jump distances precomputed for the last grid."""
+        super().reset()
+        self.jump_distances = None
+    
     def find_path(self, grid: Grid, start: Tuple[int, int], goal: Tuple[int, int]) -> PathfindingResult:
         """Find path using JPS+ with precomputed jump distances."""
         # Precompute jump distances if not done
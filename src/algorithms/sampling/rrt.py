@@ -39,6 +39,12 @@ class RRT(PathfindingAlgorithm):
         self.nodes: List[SamplingNode] = []
         self.root: Optional[SamplingNode] = None
     
+    def reset(self):
+        """Drop the tree built by the last search."""
+        super().reset()
+        self.nodes = []
+        self.root = None
+    
     def find_path(self, grid: Grid, start: Tuple[int, int], goal: Tuple[int, int]) -> PathfindingResult:
         """
         Find path using RRT algorithm.
@@ -62,8 +68,12 @@ class RRT(PathfindingAlgorithm):
         self.root = SamplingNode(float(start[0]), float(start[1]))
         self.nodes.append(self.root)
         
-        goal_node = SamplingNode(float(goal[0]), float(goal[1]))
+        gx, gy = float(goal[0]), float(goal[1])
         goal_threshold = 0.5  # Distance threshold for reaching goal
+        goal_threshold_sq = goal_threshold * goal_threshold
+        
+        # Goal-biased iterations all sample the same point, so build it once
+        goal_sample = SamplingNode(gx, gy)
         
         for iteration in range(self.max_iterations):
             self._increment_iteration()
@@ -71,7 +81,7 @@ class RRT(PathfindingAlgorithm):
             
             # Sample random point (with goal bias)
             if random.random() < self.goal_bias:
-                sample = goal_node
+                sample = goal_sample
             else:
                 sample = self._sample_random_point(grid)
             
@@ -88,7 +98,12 @@ class RRT(PathfindingAlgorithm):
                 self._expand_node()
                 
                 # Check if goal is reached
-                if new_node.distance_to(goal_node) <= goal_threshold:
+                dx = gx - new_node.x
+                dy = gy - new_node.y
+                if dx * dx + dy * dy <= goal_threshold_sq:
+                    # Terminal node is only built once the goal is in reach
+                    goal_node = SamplingNode(gx, gy)
+                    
                     # Connect to goal if possible
                     if self._is_collision_free(grid, new_node, goal_node):
                         goal_node.parent = new_node
@@ -116,16 +131,8 @@ class RRT(PathfindingAlgorithm):
         if not self.nodes:
             return None
         
-        nearest = self.nodes[0]
-        min_distance = nearest.distance_to(sample)
-        
-        for node in self.nodes[1:]:
-            distance = node.distance_to(sample)
-            if distance < min_distance:
-                min_distance = distance
-                nearest = node
-        
-        return nearest
+        # Squared distance preserves the ordering and skips a sqrt per node
+        return min(self.nodes, key=sample.distance_to_sq)
     
     def _extend_tree(self, grid: Grid, from_node: SamplingNode, toward_sample: SamplingNode) -> Optional[SamplingNode]:
         """
@@ -165,6 +172,15 @@ class RRT(PathfindingAlgorithm):
         
         Uses line sampling to check for obstacles along the path.
         """
+        # A short segment between the same or 4-adjacent cells can only touch
+        # its two endpoint cells; diagonal neighbours still need line sampling
+        # so corner cuts are caught
+        if max(abs(to_node.x - from_node.x), abs(to_node.y - from_node.y)) < 1.0:
+            from_x, from_y = int(round(from_node.x)), int(round(from_node.y))
+            to_x, to_y = int(round(to_node.x)), int(round(to_node.y))
+            if from_x == to_x or from_y == to_y:
+                return grid.is_walkable(from_x, from_y) and grid.is_walkable(to_x, to_y)
+        
         # Sample points along the line
         num_samples = max(10, int(from_node.distance_to(to_node) * 2))
         
@@ -188,10 +204,11 @@ class RRT(PathfindingAlgorithm):
         current = goal_node
         
         while current is not None:
-            path.append(current.position)
+            path.append((current.x, current.y))
             current = current.parent
         
-        return list(reversed(path))
+        path.reverse()
+        return path
 
 
 class RRTStar(RRT):
@@ -231,7 +248,7 @@ class RRTStar(RRT):
                         best_cost = potential_cost
             
             # Update parent if better one found
-            if best_parent != from_node:
+            if best_parent is not from_node:
                 from_node.remove_child(new_node)
                 best_parent.add_child(new_node)
                 new_node.cost = best_cost
@@ -245,8 +262,10 @@ class RRTStar(RRT):
         """Find all nodes within rewiring radius."""
         nearby = []
         
+        radius_sq = radius * radius
+        
         for existing_node in self.nodes:
-            if existing_node != node and existing_node.distance_to(node) <= radius:
+            if existing_node is not node and existing_node.distance_to_sq(node) <= radius_sq:
                 nearby.append(existing_node)
         
         return nearby
@@ -355,7 +374,7 @@ class RRTConnect(PathfindingAlgorithm):
                              sample: SamplingNode) -> Optional[SamplingNode]:
         """Extend a tree toward a sample point."""
         # Find nearest node in tree
-        nearest = min(tree, key=lambda node: node.distance_to(sample))
+        nearest = min(tree, key=sample.distance_to_sq)
         
         # Calculate extension direction
         dx = sample.x - nearest.x
@@ -385,7 +404,7 @@ class RRTConnect(PathfindingAlgorithm):
                       source_node: SamplingNode) -> Optional[SamplingNode]:
         """Try to connect source node to target tree."""
         # Find nearest node in target tree
-        nearest = min(target_tree, key=lambda node: node.distance_to(source_node))
+        nearest = min(target_tree, key=source_node.distance_to_sq)
         
         # Check if direct connection is possible
         if self._is_collision_free(grid, source_node, nearest):
@@ -395,6 +414,13 @@ class RRTConnect(PathfindingAlgorithm):
     
     def _is_collision_free(self, grid: Grid, from_node: SamplingNode, to_node: SamplingNode) -> bool:
         """Check if path between nodes is collision-free."""
+        # Same shortcut as RRT._is_collision_free, never across a diagonal
+        if max(abs(to_node.x - from_node.x), abs(to_node.y - from_node.y)) < 1.0:
+            from_x, from_y = int(round(from_node.x)), int(round(from_node.y))
+            to_x, to_y = int(round(to_node.x)), int(round(to_node.y))
+            if from_x == to_x or from_y == to_y:
+                return grid.is_walkable(from_x, from_y) and grid.is_walkable(to_x, to_y)
+        
         num_samples = max(10, int(from_node.distance_to(to_node) * 2))
         
         for i in range(num_samples + 1):
@@ -6,8 +6,417 @@ This report provides an in-depth comparison and analysis of pathfinding algorith
 across multiple dimensions: performance, optimality, memory usage, and use cases.
 """
 
-from typing import Dict, List, Tuple, Any
-import json
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Tuple, Any
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into read-only equivalents."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Comprehensive data about each algorithm, built once at import and shared
+# by every report instance
+_ALGORITHM_DATA: Mapping[str, Mapping[str, Any]] = _freeze({
+    "A*": {
+        "category": "Classical",
+        "optimality": "Optimal",
+        "time_complexity": "O(b^d)",
+        "space_complexity": "O(b^d)",
+        "completeness": "Complete",
+        "heuristic_requirement": "Admissible",
+        "strengths": [
+            "Guaranteed optimal paths with admissible heuristic",
+            "Well-studied and understood",
+            "Good general-purpose performance",
+            "Widely applicable"
+        ],
+        "weaknesses": [
+            "Memory usage can be high",
+            "Limited to grid-aligned movement",
+            "Performance degrades with poor heuristics"
+        ],
+        "best_use_cases": [
+            "General-purpose pathfinding",
+            "Grid-based games",
+            "Navigation systems",
+            "When optimality is required"
+        ],
+        "avoid_when": [
+            "Memory is severely constrained",
+            "Smooth movement is critical",
+            "Environment changes frequently"
+        ],
+        "typical_performance": {
+            "small_grids": "Excellent",
+            "large_grids": "Good", 
+            "open_spaces": "Good",
+            "dense_obstacles": "Fair"
+        }
+    },
+    
+    "Weighted A*": {
+        "category": "Classical",
+        "optimality": "Bounded Suboptimal",
+        "time_complexity": "O(b^d)",
+        "space_complexity": "O(b^d)", 
+        "completeness": "Complete",
+        "heuristic_requirement": "Admissible (weighted)",
+        "strengths": [
+            "Faster than standard A*",
+            "Tunable performance vs quality trade-off",
+            "Bounded suboptimality guarantee",
+            "Good for real-time systems"
+        ],
+        "weaknesses": [
+            "Produces suboptimal paths",
+            "Quality depends on weight selection",
+            "Still has A*'s memory requirements"
+        ],
+        "best_use_cases": [
+            "Real-time pathfinding",
+            "Games with time constraints",
+            "When approximate solutions are acceptable",
+            "Performance-critical applications"
+        ],
+        "avoid_when": [
+            "Optimal paths are strictly required",
+            "Path quality is more important than speed"
+        ],
+        "typical_performance": {
+            "small_grids": "Excellent",
+            "large_grids": "Very Good",
+            "open_spaces": "Excellent", 
+            "dense_obstacles": "Good"
+        }
+    },
+    
+    "Dijkstra": {
+        "category": "Classical",
+        "optimality": "Optimal",
+        "time_complexity": "O(V log V + E)",
+        "space_complexity": "O(V)",
+        "completeness": "Complete",
+        "heuristic_requirement": "None",
+        "strengths": [
+            "Guaranteed shortest paths",
+            "No heuristic required",
+            "Finds paths to all reachable nodes",
+            "Excellent for multiple goals"
+        ],
+        "weaknesses": [
+            "Explores uniformly in all directions",
+            "Slower than A* with good heuristic",
+            "Higher memory usage for large graphs"
+        ],
+        "best_use_cases": [
+            "Finding shortest paths to multiple destinations",
+            "When no good heuristic is available",
+            "Preprocessing shortest path distances",
+            "Network routing applications"
+        ],
+        "avoid_when": [
+            "Single goal pathfinding with good heuristic available",
+            "Real-time constraints are tight"
+        ],
+        "typical_performance": {
+            "small_grids": "Good",
+            "large_grids": "Fair",
+            "open_spaces": "Fair",
+            "dense_obstacles": "Fair"
+        }
+    },
+    
+    "Theta*": {
+        "category": "Any-Angle",
+        "optimality": "Optimal",
+        "time_complexity": "O(b^d)",
+        "space_complexity": "O(b^d)",
+        "completeness": "Complete",
+        "heuristic_requirement": "Admissible",
+        "strengths": [
+            "Any-angle movement capability",
+            "Shorter, more natural paths",
+            "Optimal with admissible heuristic",
+            "Reduces path post-processing needs"
+        ],
+        "weaknesses": [
+            "Requires line-of-sight computations",
+            "Slightly higher computational cost",
+            "More complex implementation",
+            "Performance sensitive to environment"
+        ],
+        "best_use_cases": [
+            "Robotics navigation",
+            "Game character movement",
+            "When smooth paths are important",
+            "Scenarios requiring natural movement"
+        ],
+        "avoid_when": [
+            "Grid-aligned movement is sufficient",
+            "Performance is more critical than path smoothness",
+            "Line-of-sight checks are expensive"
+        ],
+        "typical_performance": {
+            "small_grids": "Good",
+            "large_grids": "Good",
+            "open_spaces": "Excellent",
+            "dense_obstacles": "Fair"
+        }
+    },
+    
+    "Jump Point Search": {
+        "category": "Optimized",
+        "optimality": "Optimal",
+        "time_complexity": "O(b^d) but much lower constant",
+        "space_complexity": "O(b^d) but much lower constant", 
+        "completeness": "Complete",
+        "heuristic_requirement": "Admissible",
+        "strengths": [
+            "Dramatically reduced node expansions",
+            "Maintains A* optimality",
+            "Excellent performance on open grids",
+            "Low memory overhead"
+        ],
+        "weaknesses": [
+            "Requires uniform movement costs",
+            "Complex implementation",
+            "Less effective with many obstacles",
+            "Limited to 8-directional movement"
+        ],
+        "best_use_cases": [
+            "Large grids with sparse obstacles",
+            "Games with open terrain", 
+            "When A* is too slow but optimality needed",
+            "Real-time pathfinding on suitable grids"
+        ],
+        "avoid_when": [
+            "Non-uniform movement costs",
+            "Dense obstacle environments",
+            "Any-angle movement required"
+        ],
+        "typical_performance": {
+            "small_grids": "Excellent",
+            "large_grids": "Excellent", 
+            "open_spaces": "Outstanding",
+            "dense_obstacles": "Good"
+        }
+    },
+    
+    "IDA*": {
+        "category": "Optimized", 
+        "optimality": "Optimal",
+        "time_complexity": "O(b^d)",
+        "space_complexity": "O(d)",
+        "completeness": "Complete",
+        "heuristic_requirement": "Admissible",
+        "strengths": [
+            "Minimal memory usage",
+            "Optimal paths guaranteed",
+            "Complete algorithm",
+            "Good for memory-constrained systems"
+        ],
+        "weaknesses": [
+            "Can revisit nodes multiple times",
+            "Variable and potentially long execution time",
+            "Poor worst-case time complexity",
+            "Not suitable for real-time applications"
+        ],
+        "best_use_cases": [
+            "Embedded systems with memory constraints",
+            "Puzzle solving",
+            "When memory is more critical than time",
+            "Offline pathfinding"
+        ],
+        "avoid_when": [
+            "Real-time performance required",
+            "Time complexity is critical",
+            "Memory is not a major constraint"
+        ],
+        "typical_performance": {
+            "small_grids": "Good",
+            "large_grids": "Poor to Fair",
+            "open_spaces": "Fair", 
+            "dense_obstacles": "Poor"
+        }
+    },
+    
+    "RRT": {
+        "category": "Sampling-Based",
+        "optimality": "Probabilistically Complete",
+        "time_complexity": "O(log n) expected",
+        "space_complexity": "O(n)",
+        "completeness": "Probabilistically Complete",
+        "heuristic_requirement": "None",
+        "strengths": [
+            "Handles complex obstacle geometries",
+            "Fast initial solutions",
+            "Good for high-dimensional spaces",
+            "Excellent for exploration"
+        ],
+        "weaknesses": [
+            "Non-deterministic results",
+            "Not guaranteed to find optimal paths",
+            "Quality varies between runs",
+            "Can get stuck in local areas"
+        ],
+        "best_use_cases": [
+            "Robot motion planning",
+            "Complex 3D environments",
+            "Path planning with many constraints",
+            "When fast approximate solutions needed"
+        ],
+        "avoid_when": [
+            "Deterministic results required",
+            "Optimal paths are critical",
+            "Simple 2D grid environments",
+            "Repeatability is important"
+        ],
+        "typical_performance": {
+            "small_grids": "Fair",
+            "large_grids": "Good",
+            "open_spaces": "Good",
+            "dense_obstacles": "Variable"
+        }
+    },
+    
+    "RRT*": {
+        "category": "Sampling-Based", 
+        "optimality": "Asymptotically Optimal",
+        "time_complexity": "O(log n) expected",
+        "space_complexity": "O(n)",
+        "completeness": "Probabilistically Complete",
+        "heuristic_requirement": "None",
+        "strengths": [
+            "Converges to optimal solution",
+            "Handles complex geometries",
+            "Improves path quality over time",
+            "Good for complex planning problems"
+        ],
+        "weaknesses": [
+            "Slower than basic RRT",
+            "Convergence can be slow", 
+            "Non-deterministic",
+            "Requires parameter tuning"
+        ],
+        "best_use_cases": [
+            "High-quality path planning",
+            "Robot motion planning",
+            "When convergence time is available",
+            "Complex constraint satisfaction"
+        ],
+        "avoid_when": [
+            "Quick approximate solutions needed",
+            "Simple environments",
+            "Real-time constraints are tight"
+        ],
+        "typical_performance": {
+            "small_grids": "Fair",
+            "large_grids": "Good",
+            "open_spaces": "Good", 
+            "dense_obstacles": "Good"
+        }
+    }
+})
+
+# Use-case guide for algorithm selection
+_DECISION_MATRIX: Mapping[str, Mapping[str, str]] = _freeze({
+    "Real-time Games": {
+        "requirements": "Fast execution, acceptable quality",
+        "recommended": "Weighted A* or Jump Point Search",
+        "avoid": "IDA*, RRT*"
+    },
+    "Robotics Navigation": {
+        "requirements": "Smooth paths, obstacle handling",
+        "recommended": "Theta* or RRT*", 
+        "avoid": "Basic A* (grid-aligned only)"
+    },
+    "Embedded Systems": {
+        "requirements": "Minimal memory usage",
+        "recommended": "IDA*",
+        "avoid": "A*, Dijkstra, RRT*"
+    },
+    "Large Scale Mapping": {
+        "requirements": "Handle big environments efficiently",
+        "recommended": "Jump Point Search or Dijkstra",
+        "avoid": "IDA*, basic RRT"
+    },
+    "Complex 3D Environments": {
+        "requirements": "Handle complex geometries",
+        "recommended": "RRT or RRT*",
+        "avoid": "Grid-based algorithms"
+    },
+    "Mission Critical Systems": {
+        "requirements": "Guaranteed optimal paths",
+        "recommended": "A* or Dijkstra",
+        "avoid": "Weighted A*, RRT variants"
+    },
+    "Dynamic Environments": {
+        "requirements": "Handle changing obstacles",
+        "recommended": "D* Lite (when implemented)",
+        "avoid": "Static algorithms"
+    },
+    "Multi-Agent Systems": {
+        "requirements": "Multiple simultaneous paths",
+        "recommended": "Dijkstra or Cooperative A*",
+        "avoid": "Sampling-based for coordination"
+    }
+})
+
+# Markdown section rendered for each algorithm in the detailed analysis
+_ALGORITHM_SECTION_TEMPLATE = """
+### {name} ({category})
+
+**Optimality**: {optimality}  
+**Time Complexity**: {time_complexity}  
+**Space Complexity**: {space_complexity}  
+**Completeness**: {completeness}
+
+**Strengths:**
+{strengths}
+
+**Weaknesses:**  
+{weaknesses}
+
+**Best Use Cases:**
+{best_use_cases}
+
+**Avoid When:**
+{avoid_when}
+
+**Performance Profile:**
+- Small Grids: {small_grids}
+- Large Grids: {large_grids} 
+- Open Spaces: {open_spaces}
+- Dense Obstacles: {dense_obstacles}
+
+---
+"""
+
+
+def _section_fields(alg_data: Mapping[str, Any]) -> Dict[str, str]:
+    """Flatten one algorithm's data into the fields of its report section."""
+    fields = {key: alg_data[key] for key in
+              ("category", "optimality", "time_complexity", "space_complexity", "completeness")}
+    for key in ("strengths", "weaknesses", "best_use_cases", "avoid_when"):
+        fields[key] = "\n".join("- " + item for item in alg_data[key])
+    fields.update(alg_data["typical_performance"])
+    return fields
+
+
+# Section fields with bullet lists pre-joined, so rendering is a single format_map
+_ALGORITHM_FIELDS = MappingProxyType({
+    name: _section_fields(data) for name, data in _ALGORITHM_DATA.items()
+})
+
+# Column order of the performance comparison table
+_TABLE_METRICS = ("Speed", "Memory Efficiency", "Path Quality",
+                  "Implementation Complexity", "Versatility")
 
 
 class PathfindingAnalysisReport:
@@ -16,357 +425,11 @@ class PathfindingAnalysisReport:
     """
     
     def __init__(self):
-        self.algorithms = self._initialize_algorithm_data()
-    
-    def _initialize_algorithm_data(self) -> Dict[str, Dict[str, Any]]:
-        """Initialize comprehensive data about each algorithm."""
-        return {
-            "A*": {
-                "category": "Classical",
-                "optimality": "Optimal",
-                "time_complexity": "O(b^d)",
-                "space_complexity": "O(b^d)",
-                "completeness": "Complete",
-                "heuristic_requirement": "Admissible",
-                "strengths": [
-                    "Guaranteed optimal paths with admissible heuristic",
-                    "Well-studied and understood",
-                    "Good general-purpose performance",
-                    "Widely applicable"
-                ],
-                "weaknesses": [
-                    "Memory usage can be high",
-                    "Limited to grid-aligned movement",
-                    "Performance degrades with poor heuristics"
-                ],
-                "best_use_cases": [
-                    "General-purpose pathfinding",
-                    "Grid-based games",
-                    "Navigation systems",
-                    "When optimality is required"
-                ],
-                "avoid_when": [
-                    "Memory is severely constrained",
-                    "Smooth movement is critical",
-                    "Environment changes frequently"
-                ],
-                "typical_performance": {
-                    "small_grids": "Excellent",
-                    "large_grids": "Good", 
-                    "open_spaces": "Good",
-                    "dense_obstacles": "Fair"
-                }
-            },
-            
-            "Weighted A*": {
-                "category": "Classical",
-                "optimality": "Bounded Suboptimal",
-                "time_complexity": "O(b^d)",
-                "space_complexity": "O(b^d)", 
-                "completeness": "Complete",
-                "heuristic_requirement": "Admissible (weighted)",
-                "strengths": [
-                    "Faster than standard A*",
-                    "Tunable performance vs quality trade-off",
-                    "Bounded suboptimality guarantee",
-                    "Good for real-time systems"
-                ],
-                "weaknesses": [
-                    "Produces suboptimal paths",
-                    "Quality depends on weight selection",
-                    "Still has A*'s memory requirements"
-                ],
-                "best_use_cases": [
-                    "Real-time pathfinding",
-                    "Games with time constraints",
-                    "When approximate solutions are acceptable",
-                    "Performance-critical applications"
-                ],
-                "avoid_when": [
-                    "Optimal paths are strictly required",
-                    "Path quality is more important than speed"
-                ],
-                "typical_performance": {
-                    "small_grids": "Excellent",
-                    "large_grids": "Very Good",
-                    "open_spaces": "Excellent", 
-                    "dense_obstacles": "Good"
-                }
-            },
-            
-            "Dijkstra": {
-                "category": "Classical",
-                "optimality": "Optimal",
-                "time_complexity": "O(V log V + E)",
-                "space_complexity": "O(V)",
-                "completeness": "Complete",
-                "heuristic_requirement": "None",
-                "strengths": [
-                    "Guaranteed shortest paths",
-                    "No heuristic required",
-                    "Finds paths to all reachable nodes",
-                    "Excellent for multiple goals"
-                ],
-                "weaknesses": [
-                    "Explores uniformly in all directions",
-                    "Slower than A* with good heuristic",
-                    "Higher memory usage for large graphs"
-                ],
-                "best_use_cases": [
-                    "Finding shortest paths to multiple destinations",
-                    "When no good heuristic is available",
-                    "Preprocessing shortest path distances",
-                    "Network routing applications"
-                ],
-                "avoid_when": [
-                    "Single goal pathfinding with good heuristic available",
-                    "Real-time constraints are tight"
-                ],
-                "typical_performance": {
-                    "small_grids": "Good",
-                    "large_grids": "Fair",
-                    "open_spaces": "Fair",
-                    "dense_obstacles": "Fair"
-                }
-            },
-            
-            "Theta*": {
-                "category": "Any-Angle",
-                "optimality": "Optimal",
-                "time_complexity": "O(b^d)",
-                "space_complexity": "O(b^d)",
-                "completeness": "Complete",
-                "heuristic_requirement": "Admissible",
-                "strengths": [
-                    "Any-angle movement capability",
-                    "Shorter, more natural paths",
-                    "Optimal with admissible heuristic",
-                    "Reduces path post-processing needs"
-                ],
-                "weaknesses": [
-                    "Requires line-of-sight computations",
-                    "Slightly higher computational cost",
-                    "More complex implementation",
-                    "Performance sensitive to environment"
-                ],
-                "best_use_cases": [
-                    "Robotics navigation",
-                    "Game character movement",
-                    "When smooth paths are important",
-                    "Scenarios requiring natural movement"
-                ],
-                "avoid_when": [
-                    "Grid-aligned movement is sufficient",
-                    "Performance is more critical than path smoothness",
-                    "Line-of-sight checks are expensive"
-                ],
-                "typical_performance": {
-                    "small_grids": "Good",
-                    "large_grids": "Good",
-                    "open_spaces": "Excellent",
-                    "dense_obstacles": "Fair"
-                }
-            },
-            
-            "Jump Point Search": {
-                "category": "Optimized",
-                "optimality": "Optimal",
-                "time_complexity": "O(b^d) but much lower constant",
-                "space_complexity": "O(b^d) but much lower constant", 
-                "completeness": "Complete",
-                "heuristic_requirement": "Admissible",
-                "strengths": [
-                    "Dramatically reduced node expansions",
-                    "Maintains A* optimality",
-                    "Excellent performance on open grids",
-                    "Low memory overhead"
-                ],
-                "weaknesses": [
-                    "Requires uniform movement costs",
-                    "Complex implementation",
-                    "Less effective with many obstacles",
-                    "Limited to 8-directional movement"
-                ],
-                "best_use_cases": [
-                    "Large grids with sparse obstacles",
-                    "Games with open terrain", 
-                    "When A* is too slow but optimality needed",
-                    "Real-time pathfinding on suitable grids"
-                ],
-                "avoid_when": [
-                    "Non-uniform movement costs",
-                    "Dense obstacle environments",
-                    "Any-angle movement required"
-                ],
-                "typical_performance": {
-                    "small_grids": "Excellent",
-                    "large_grids": "Excellent", 
-                    "open_spaces": "Outstanding",
-                    "dense_obstacles": "Good"
-                }
-            },
-            
-            "IDA*": {
-                "category": "Optimized", 
-                "optimality": "Optimal",
-                "time_complexity": "O(b^d)",
-                "space_complexity": "O(d)",
-                "completeness": "Complete",
-                "heuristic_requirement": "Admissible",
-                "strengths": [
-                    "Minimal memory usage",
-                    "Optimal paths guaranteed",
-                    "Complete algorithm",
-                    "Good for memory-constrained systems"
-                ],
-                "weaknesses": [
-                    "Can revisit nodes multiple times",
-                    "Variable and potentially long execution time",
-                    "Poor worst-case time complexity",
-                    "Not suitable for real-time applications"
-                ],
-                "best_use_cases": [
-                    "Embedded systems with memory constraints",
-                    "Puzzle solving",
-                    "When memory is more critical than time",
-                    "Offline pathfinding"
-                ],
-                "avoid_when": [
-                    "Real-time performance required",
-                    "Time complexity is critical",
-                    "Memory is not a major constraint"
-                ],
-                "typical_performance": {
-                    "small_grids": "Good",
-                    "large_grids": "Poor to Fair",
-                    "open_spaces": "Fair", 
-                    "dense_obstacles": "Poor"
-                }
-            },
-            
-            "RRT": {
-                "category": "Sampling-Based",
-                "optimality": "Probabilistically Complete",
-                "time_complexity": "O(log n) expected",
-                "space_complexity": "O(n)",
-                "completeness": "Probabilistically Complete",
-                "heuristic_requirement": "None",
-                "strengths": [
-                    "Handles complex obstacle geometries",
-                    "Fast initial solutions",
-                    "Good for high-dimensional spaces",
-                    "Excellent for exploration"
-                ],
-                "weaknesses": [
-                    "Non-deterministic results",
-                    "Not guaranteed to find optimal paths",
-                    "Quality varies between runs",
-                    "Can get stuck in local areas"
-                ],
-                "best_use_cases": [
-                    "Robot motion planning",
-                    "Complex 3D environments",
-                    "Path planning with many constraints",
-                    "When fast approximate solutions needed"
-                ],
-                "avoid_when": [
-                    "Deterministic results required",
-                    "Optimal paths are critical",
-                    "Simple 2D grid environments",
-                    "Repeatability is important"
-                ],
-                "typical_performance": {
-                    "small_grids": "Fair",
-                    "large_grids": "Good",
-                    "open_spaces": "Good",
-                    "dense_obstacles": "Variable"
-                }
-            },
-            
-            "RRT*": {
-                "category": "Sampling-Based", 
-                "optimality": "Asymptotically Optimal",
-                "time_complexity": "O(log n) expected",
-                "space_complexity": "O(n)",
-                "completeness": "Probabilistically Complete",
-                "heuristic_requirement": "None",
-                "strengths": [
-                    "Converges to optimal solution",
-                    "Handles complex geometries",
-                    "Improves path quality over time",
-                    "Good for complex planning problems"
-                ],
-                "weaknesses": [
-                    "Slower than basic RRT",
-                    "Convergence can be slow", 
-                    "Non-deterministic",
-                    "Requires parameter tuning"
-                ],
-                "best_use_cases": [
-                    "High-quality path planning",
-                    "Robot motion planning",
-                    "When convergence time is available",
-                    "Complex constraint satisfaction"
-                ],
-                "avoid_when": [
-                    "Quick approximate solutions needed",
-                    "Simple environments",
-                    "Real-time constraints are tight"
-                ],
-                "typical_performance": {
-                    "small_grids": "Fair",
-                    "large_grids": "Good",
-                    "open_spaces": "Good", 
-                    "dense_obstacles": "Good"
-                }
-            }
-        }
+        self.algorithms = _ALGORITHM_DATA
     
-    def generate_decision_matrix(self) -> Dict[str, Dict[str, str]]:
+    def generate_decision_matrix(self) -> Mapping[str, Mapping[str, str]]:
         """Generate decision matrix for algorithm selection."""
-        scenarios = {
-            "Real-time Games": {
-                "requirements": "Fast execution, acceptable quality",
-                "recommended": "Weighted A* or Jump Point Search",
-                "avoid": "IDA*, RRT*"
-            },
-            "Robotics Navigation": {
-                "requirements": "Smooth paths, obstacle handling",
-                "recommended": "Theta* or RRT*", 
-                "avoid": "Basic A* (grid-aligned only)"
-            },
-            "Embedded Systems": {
-                "requirements": "Minimal memory usage",
-                "recommended": "IDA*",
-                "avoid": "A*, Dijkstra, RRT*"
-            },
-            "Large Scale Mapping": {
-                "requirements": "Handle big environments efficiently",
-                "recommended": "Jump Point Search or Dijkstra",
-                "avoid": "IDA*, basic RRT"
-            },
-            "Complex 3D Environments": {
-                "requirements": "Handle complex geometries",
-                "recommended": "RRT or RRT*",
-                "avoid": "Grid-based algorithms"
-            },
-            "Mission Critical Systems": {
-                "requirements": "Guaranteed optimal paths",
-                "recommended": "A* or Dijkstra",
-                "avoid": "Weighted A*, RRT variants"
-            },
-            "Dynamic Environments": {
-                "requirements": "Handle changing obstacles",
-                "recommended": "D* Lite (when implemented)",
-                "avoid": "Static algorithms"
-            },
-            "Multi-Agent Systems": {
-                "requirements": "Multiple simultaneous paths",
-                "recommended": "Dijkstra or Cooperative A*",
-                "avoid": "Sampling-based for coordination"
-            }
-        }
-        return scenarios
+        return _DECISION_MATRIX
     
     def generate_performance_comparison(self) -> Dict[str, Dict[str, float]]:
         """Generate relative performance comparison (normalized scores 0-1)."""
@@ -423,13 +486,30 @@ class PathfindingAnalysisReport:
             }
         }
     
+    @staticmethod
+    def _performance_table_rows(performance: Dict[str, Dict[str, float]]) -> Dict[str, Tuple[float, ...]]:
+        """Transpose per-metric scores into one row of table columns per algorithm."""
+        columns = [performance[metric] for metric in _TABLE_METRICS]
+        return {
+            alg: tuple(column.get(alg, 0) for column in columns)
+            for alg in performance['Speed']
+        }
+    
     def generate_comprehensive_report(self) -> str:
         """Generate comprehensive analysis report."""
-        
+        return self._comprehensive_report
+    
+    @cached_property
+    def _comprehensive_report(self) -> str:
+        """Render the report once; the algorithm data is fixed after construction."""
+        return "".join(self._iter_report_chunks())
+    
+    def _iter_report_chunks(self) -> Iterator[str]:
+        """Yield the report as a sequence of Markdown fragments."""
         decision_matrix = self.generate_decision_matrix()
         performance = self.generate_performance_comparison()
         
-        report = f"""
+        yield f"""
 # COMPREHENSIVE PATHFINDING ALGORITHMS ANALYSIS REPORT
 {"="*70}
 
@@ -470,37 +550,10 @@ dimensions including performance, optimality, memory usage, and practical applic
 """
         
         # Add detailed analysis for each algorithm
-        for alg_name, alg_data in self.algorithms.items():
-            report += f"""
-### {alg_name} ({alg_data['category']})
-
-**Optimality**: {alg_data['optimality']}  
-**Time Complexity**: {alg_data['time_complexity']}  
-**Space Complexity**: {alg_data['space_complexity']}  
-**Completeness**: {alg_data['completeness']}
-
-**Strengths:**
-{chr(10).join(f"- {s}" for s in alg_data['strengths'])}
+        for alg_name in self.algorithms:
+            yield _ALGORITHM_SECTION_TEMPLATE.format_map({'name': alg_name, **_ALGORITHM_FIELDS[alg_name]})
 
-**Weaknesses:**  
-{chr(10).join(f"- {w}" for w in alg_data['weaknesses'])}
-
-**Best Use Cases:**
-{chr(10).join(f"- {u}" for u in alg_data['best_use_cases'])}
-
-**Avoid When:**
-{chr(10).join(f"- {a}" for a in alg_data['avoid_when'])}
-
-**Performance Profile:**
-- Small Grids: {alg_data['typical_performance']['small_grids']}
-- Large Grids: {alg_data['typical_performance']['large_grids']} 
-- Open Spaces: {alg_data['typical_performance']['open_spaces']}
-- Dense Obstacles: {alg_data['typical_performance']['dense_obstacles']}
-
----
-"""
-
-        report += f"""
+        yield f"""
 ## Performance Comparison Matrix
 
 The following shows relative performance scores (0.0 - 1.0) across key metrics:
@@ -510,17 +563,11 @@ The following shows relative performance scores (0.0 - 1.0) across key metrics:
 """
         
         # Generate performance table
-        algorithms = list(performance['Speed'].keys())
-        for alg in algorithms:
-            speed = performance['Speed'].get(alg, 0)
-            memory = performance['Memory Efficiency'].get(alg, 0) 
-            quality = performance['Path Quality'].get(alg, 0)
-            complexity = performance['Implementation Complexity'].get(alg, 0)
-            versatility = performance['Versatility'].get(alg, 0)
-            
-            report += f"| {alg:<17} | {speed:>5.1f} | {memory:>6.1f} | {quality:>7.1f} | {complexity:>10.1f} | {versatility:>11.1f} |\\n"
-
-        report += f"""
+        rows = self._performance_table_rows(performance)
+        for alg, (speed, memory, quality, complexity, versatility) in rows.items():
+            yield f"| {alg:<17} | {speed:>5.1f} | {memory:>6.1f} | {quality:>7.1f} | {complexity:>10.1f} | {versatility:>11.1f} |\n"
+
+        yield f"""
 
 ## Decision Matrix - Algorithm Selection by Use Case
 
@@ -529,14 +576,14 @@ The following guide helps select algorithms based on specific requirements:
 """
         
         for scenario, details in decision_matrix.items():
-            report += f"""
+            yield f"""
 ### {scenario}
 - **Requirements**: {details['requirements']}
 - **Recommended**: {details['recommended']} 
 - **Avoid**: {details['avoid']}
 """
 
-        report += f"""
+        yield f"""
 
 ## Implementation Recommendations
 
@@ -601,15 +648,15 @@ with comprehensive benchmarking tools to validate performance in specific scenar
 ---
 *Report generated by Pathfinding Algorithms Analysis Framework*
 """
-        
-        return report
     
     def save_report(self, filename: str = "pathfinding_analysis_report.md"):
         """Save the comprehensive report to file."""
-        report_content = self.generate_comprehensive_report()
-        
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+            # Reuse the report if it was already built; otherwise stream it
+            if '_comprehensive_report' in self.__dict__:
+                f.write(self._comprehensive_report)
+            else:
+                f.writelines(self._iter_report_chunks())
         
         print(f"Comprehensive analysis report saved to {filename}")
         return filename
@@ -619,11 +666,11 @@ with comprehensive benchmarking tools to validate performance in specific scenar
 if __name__ == "__main__":
     analyzer = PathfindingAnalysisReport()
     analyzer.save_report()
-    print("\\nPathfinding algorithms analysis report generated successfully!")
-    print("\\nKey takeaways:")
+    print("\nPathfinding algorithms analysis report generated successfully!")
+    print("\nKey takeaways:")
     print("- A* is the best general-purpose algorithm")
     print("- Jump Point Search offers major speedups on suitable grids")
     print("- Theta* provides smooth any-angle movement") 
     print("- IDA* minimizes memory usage while maintaining optimality")
     print("- RRT family excels in complex, high-dimensional environments")
-    print("\\nUse the benchmarking framework to validate performance for your specific use case!")
\ No newline at end of file
+    print("\nUse the benchmarking framework to validate performance for your specific use case!")
\ No newline at end of file
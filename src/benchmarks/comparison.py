@@ -4,15 +4,23 @@ Comprehensive benchmarking and analysis system for pathfinding algorithms.
 """
 
 import time
+import heapq
+import random
+import signal
 import statistics
 import json
+import gzip
+import threading
+from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor
+from collections import defaultdict
 from typing import List, Dict, Any, Tuple, Type, Optional
 from dataclasses import dataclass
 from enum import Enum
 
 from ..core import PathfindingAlgorithm, PathfindingResult, Grid, AngleGrid, DynamicGrid
 from ..algorithms.classical import AStar, WeightedAStar, Dijkstra
-from ..algorithms.any_angle import ThetaStar, BasicThetaStar
+from ..algorithms.any_angle import ThetaStar
 from ..algorithms.optimized import JumpPointSearch, IDAStar
 from ..algorithms.sampling import RRT, RRTStar
 
@@ -27,6 +35,222 @@ class TestScenario(Enum):
     WEIGHTED_TERRAIN = "Weighted Terrain"
 
 
+# Number of algorithms kept in each ranking
+_RANKING_DEPTH = 5
+
+# Results are keyed by (scenario name, grid size, obstacle density)
+ScenarioKey = Tuple[str, Tuple[int, int], float]
+
+
+def _positive_mean(values: List[float]) -> float:
+    """Mean of the positive values, or infinity when there are none."""
+    positive = [v for v in values if v > 0]
+    return statistics.mean(positive) if positive else float('inf')
+
+
+def _scenario_key_to_str(key: ScenarioKey) -> str:
+    """Flatten a results key into the string form used in saved results."""
+    scenario_name, (width, height), obstacle_density = key
+    return f"{scenario_name}_{width}x{height}_{obstacle_density:.1f}"
+
+
+# Constructor arguments for algorithms that need non-default benchmark settings
+_ALGORITHM_KWARGS: Dict[Type[PathfindingAlgorithm], Dict[str, Any]] = {
+    WeightedAStar: {'heuristic_weight': 1.5},
+    RRT: {'max_iterations': 5000},
+    RRTStar: {'max_iterations': 3000},
+}
+
+
+# Algorithm instances reused across trials within a process,
+# keyed by class and constructor arguments
+_algorithm_pool: Dict[Tuple[Type[PathfindingAlgorithm], frozenset], PathfindingAlgorithm] = {}
+
+
+def _get_algorithm(algorithm_class: Type[PathfindingAlgorithm]) -> PathfindingAlgorithm:
+    """
+    Get a pooled algorithm instance with its benchmark settings.
+    
+    Callers must reset() the instance before each search.
+    """
+    kwargs = _ALGORITHM_KWARGS.get(algorithm_class, {})
+    key = (algorithm_class, frozenset(kwargs.items()))
+    
+    algorithm = _algorithm_pool.get(key)
+    if algorithm is None:
+        algorithm = algorithm_class(**kwargs)
+        # Trials copy what they need out of the result, so it can be reused too
+        algorithm.result_buffer = PathfindingResult()
+        _algorithm_pool[key] = algorithm
+    
+    return algorithm
+
+
+def _carve_narrow_passages(grid: Grid):
+    """
+    Wall off the grid every 8 cells, leaving gaps on every 16th line.
+    
+    A cell is a wall when x or y is a multiple of 8, unless x or y is
+    8 mod 16. That only leaves walls on rows and columns that are
+    multiples of 16, so just those lines are visited.
+    """
+    for y in range(0, grid.height, 16):
+        for x in range(grid.width):
+            if x % 16 != 8:
+                grid.set_walkable(x, y, False)
+    
+    for x in range(0, grid.width, 16):
+        for y in range(grid.height):
+            if y % 16 != 8:
+                grid.set_walkable(x, y, False)
+
+
+def _trial_statistics(trials: List[Dict[str, Any]], success_count: int) -> Dict[str, float]:
+    """
+    Summarize successful trials in a single pass.
+    
+    Means are accumulated as running sums; the two standard deviations use
+    Welford's update so no per-metric lists are built.
+    """
+    n = 0
+    sum_nodes_expanded = sum_nodes_visited = sum_memory_usage = 0
+    mean_time = m2_time = 0.0
+    mean_length = m2_length = 0.0
+    min_time = float('inf')
+    max_time = float('-inf')
+    
+    for t in trials:
+        if not t['success']:
+            continue
+        
+        n += 1
+        execution_time = t['execution_time']
+        path_length = t['path_length']
+        
+        delta = execution_time - mean_time
+        mean_time += delta / n
+        m2_time += delta * (execution_time - mean_time)
+        
+        delta = path_length - mean_length
+        mean_length += delta / n
+        m2_length += delta * (path_length - mean_length)
+        
+        sum_nodes_expanded += t['nodes_expanded']
+        sum_nodes_visited += t['nodes_visited']
+        sum_memory_usage += t['memory_usage']
+        min_time = min(min_time, execution_time)
+        max_time = max(max_time, execution_time)
+    
+    stats = {
+        'success_rate': success_count / len(trials) if trials else 0,
+        'avg_execution_time': mean_time if n else 0,
+        'avg_path_length': mean_length if n else 0,
+        'avg_nodes_expanded': sum_nodes_expanded / n if n else 0,
+        'avg_nodes_visited': sum_nodes_visited / n if n else 0,
+        'avg_memory_usage': sum_memory_usage / n if n else 0,
+    }
+    
+    if n:
+        stats.update({
+            'std_execution_time': (m2_time / (n - 1)) ** 0.5 if n > 1 else 0,
+            'std_path_length': (m2_length / (n - 1)) ** 0.5 if n > 1 else 0,
+            'min_execution_time': min_time,
+            'max_execution_time': max_time,
+        })
+    
+    return stats
+
+
+def _raise_trial_timeout(signum, frame):
+    """SIGALRM handler that aborts the running trial."""
+    raise TimeoutError("Timeout exceeded")
+
+
+@contextmanager
+def _trial_deadline(timeout_seconds: float):
+    """
+    Interrupt the enclosed block with TimeoutError once the timeout elapses.
+    
+    Uses a real-time interval timer, which needs SIGALRM and the main thread.
+    Elsewhere (e.g. Windows) the block runs to completion and callers fall
+    back to checking the elapsed time afterwards.
+    """
+    if not hasattr(signal, 'setitimer') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    
+    previous_handler = signal.signal(signal.SIGALRM, _raise_trial_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+    
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _init_worker():
+    """
+    Reseed the global random generator in a fresh worker process.
+    
+    Forked workers inherit the parent's generator state, so without this
+    every worker would draw the same samples for unseeded searches.
+    """
+    random.seed()
+
+
+def _run_trial(algorithm_class: Type[PathfindingAlgorithm], grid_class: Type[Grid],
+               width: int, height: int, walkable: bytes,
+               start: Tuple[int, int], goal: Tuple[int, int],
+               search_seed: Optional[int], timeout_seconds: float) -> Dict[str, Any]:
+    """
+    Run one benchmark trial in a worker process.
+    
+    The grid travels as packed walkability bytes, which pickle far more
+    cheaply than the node objects, and is rebuilt here. When ``search_seed``
+    is given the global random generator is seeded with it first, so
+    sampling-based searches reproduce regardless of which worker runs them.
+    """
+    grid = grid_class.from_walkable_bytes(width, height, walkable)
+    algorithm = _get_algorithm(algorithm_class)
+    
+    if search_seed is not None:
+        random.seed(search_seed)
+    
+    # Run algorithm with timeout
+    start_time = time.perf_counter()
+    
+    try:
+        algorithm.reset()
+        
+        with _trial_deadline(timeout_seconds):
+            result = algorithm.find_path(grid, start, goal)
+        
+        elapsed_time = time.perf_counter() - start_time
+        
+        if elapsed_time > timeout_seconds:
+            result.found = False
+            result.error_message = "Timeout exceeded"
+        
+    except Exception as e:
+        elapsed_time = time.perf_counter() - start_time
+        result = PathfindingResult()
+        result.found = False
+        result.error_message = str(e)
+        result.execution_time = elapsed_time
+    
+    return {
+        'success': result.found,
+        'execution_time': result.execution_time,
+        'path_length': result.path_length,
+        'nodes_expanded': result.nodes_expanded,
+        'nodes_visited': result.nodes_visited,
+        'memory_usage': result.memory_usage,
+        'algorithm_data': result.algorithm_data,
+        'error': result.error_message
+    }
+
+
 @dataclass
 class BenchmarkConfig:
     """Configuration for benchmark tests."""
@@ -36,6 +260,8 @@ class BenchmarkConfig:
     scenarios: List[TestScenario] = None
     algorithms: List[Type[PathfindingAlgorithm]] = None
     timeout_seconds: float = 30.0
+    max_workers: Optional[int] = None  # Worker processes; None uses every CPU
+    seed: Optional[int] = None  # Seed for reproducible test problems and searches
     
     def __post_init__(self):
         if self.grid_sizes is None:
@@ -61,40 +287,66 @@ class AlgorithmBenchmark:
     
     def __init__(self, config: BenchmarkConfig = None):
         self.config = config or BenchmarkConfig()
-        self.results: Dict[str, List[Dict]] = {}
+        self.results: Dict[ScenarioKey, List[Dict]] = {}
+        self._analysis_cache: Optional[Dict[str, Any]] = None
     
     def run_comprehensive_benchmark(self) -> Dict[str, Any]:
         """
         Run comprehensive benchmark across all configurations.
         
+        Trials are independent, so they are fanned out across a process pool
+        and regrouped per scenario as they complete.
+        
         Returns:
             Dictionary containing all benchmark results and analysis
         """
         print("Starting comprehensive pathfinding algorithm benchmark...")
         
+        tests_per_scenario = len(self.config.algorithms) * self.config.num_trials
         total_tests = (len(self.config.grid_sizes) * 
                       len(self.config.obstacle_densities) * 
                       len(self.config.scenarios) * 
-                      len(self.config.algorithms) * 
-                      self.config.num_trials)
+                      tests_per_scenario)
         
-        test_count = 0
+        # Lay out every trial up-front so the whole sweep can be submitted at once
+        tasks: List[Tuple] = []
+        scenario_plans = []
         
         for grid_size in self.config.grid_sizes:
             for obstacle_density in self.config.obstacle_densities:
                 for scenario in self.config.scenarios:
-                    print(f"\\nTesting scenario: {scenario.value} ({grid_size[0]}x{grid_size[1]}, {obstacle_density:.1%} obstacles)")
-                    
-                    scenario_results = self._benchmark_scenario(
-                        grid_size, obstacle_density, scenario
-                    )
-                    
-                    scenario_key = f"{scenario.value}_{grid_size[0]}x{grid_size[1]}_{obstacle_density:.1f}"
-                    self.results[scenario_key] = scenario_results
-                    
-                    test_count += len(self.config.algorithms) * self.config.num_trials
-                    progress = (test_count / total_tests) * 100
-                    print(f"Progress: {progress:.1f}% ({test_count}/{total_tests} tests)")
+                    scenario_key = (scenario.value, grid_size, obstacle_density)
+                    label = f"{scenario.value} ({grid_size[0]}x{grid_size[1]}, {obstacle_density:.1%} obstacles)"
+                    algorithm_plans = self._benchmark_scenario(grid_size, obstacle_density, scenario, tasks)
+                    scenario_plans.append((scenario_key, label, algorithm_plans))
+        
+        # Shuffle submission order so heavy algorithms don't pile up on one worker
+        submission_order = list(range(len(tasks)))
+        random.shuffle(submission_order)
+        
+        test_count = 0
+        
+        # Results are about to change, so any earlier analysis is stale
+        self._analysis_cache = None
+        
+        executor = ProcessPoolExecutor(max_workers=self.config.max_workers, initializer=_init_worker)
+        
+        try:
+            futures: List[Optional[Future]] = [None] * len(tasks)
+            for index in submission_order:
+                futures[index] = executor.submit(_run_trial, *tasks[index])
+            
+            # One progress line per completed scenario
+            for scenario_key, label, algorithm_plans in scenario_plans:
+                self.results[scenario_key] = [
+                    self._benchmark_algorithm(plan, futures) for plan in algorithm_plans
+                ]
+                
+                test_count += tests_per_scenario
+                print(f"[{test_count * 100 // total_tests:3d}%] {label}: {test_count}/{total_tests} tests")
+        finally:
+            # Don't block on trials that overran their deadline
+            executor.shutdown(wait=False, cancel_futures=True)
         
         # Analyze results
         analysis = self._analyze_results()
@@ -107,138 +359,129 @@ class AlgorithmBenchmark:
         }
     
     def _benchmark_scenario(self, grid_size: Tuple[int, int], obstacle_density: float, 
-                          scenario: TestScenario) -> List[Dict[str, Any]]:
-        """Benchmark all algorithms on a specific scenario."""
-        scenario_results = []
-        
-        for algorithm_class in self.config.algorithms:
-            algorithm_results = self._benchmark_algorithm(
-                algorithm_class, grid_size, obstacle_density, scenario
-            )
-            scenario_results.append(algorithm_results)
+                          scenario: TestScenario, tasks: List[Tuple]) -> List[Dict[str, Any]]:
+        """
+        Plan the trials of every algorithm on a specific scenario.
         
-        return scenario_results
-    
-    def _benchmark_algorithm(self, algorithm_class: Type[PathfindingAlgorithm],
-                           grid_size: Tuple[int, int], obstacle_density: float,
-                           scenario: TestScenario) -> Dict[str, Any]:
-        """Benchmark a single algorithm on multiple trials."""
+        Trial tasks are appended to ``tasks``; the returned plans record which
+        task index belongs to which algorithm and trial.
+        """
         width, height = grid_size
+        scenario_plans = []
         
-        # Create algorithm instance
-        try:
-            if algorithm_class in [ThetaStar, BasicThetaStar]:
-                algorithm = algorithm_class()
-            elif algorithm_class == WeightedAStar:
-                algorithm = algorithm_class(heuristic_weight=1.5)
-            elif algorithm_class == RRT:
-                algorithm = algorithm_class(max_iterations=5000)
-            elif algorithm_class == RRTStar:
-                algorithm = algorithm_class(max_iterations=3000)
-            else:
-                algorithm = algorithm_class()
-        except Exception as e:
-            return {
-                'algorithm': algorithm_class.__name__,
-                'error': f"Failed to initialize: {str(e)}",
-                'trials': []
-            }
-        
-        trials = []
-        success_count = 0
+        # Build each trial's problem once and share it across every algorithm,
+        # so all algorithms are compared on the same grids and endpoints
+        problems = []
         
         for trial in range(self.config.num_trials):
+            rng = self._trial_rng(grid_size, obstacle_density, scenario, trial)
+            
             try:
                 # Create grid based on scenario
-                grid = self._create_test_grid(width, height, obstacle_density, scenario)
+                grid = self._create_test_grid(width, height, obstacle_density, scenario, rng)
                 
                 # Generate start and goal positions
-                start, goal = self._generate_test_positions(grid)
+                start, goal = self._generate_test_positions(grid, rng)
                 
                 if not start or not goal:
                     continue
                 
-                # Run algorithm with timeout
-                start_time = time.perf_counter()
+                # Seed for the search itself, drawn after the problem is built
+                search_seed = rng.getrandbits(64) if self.config.seed is not None else None
+                
+                problems.append((trial, (type(grid), grid.width, grid.height,
+                                         grid.to_walkable_bytes(), start, goal, search_seed), None))
+                
+            except Exception as e:
+                problems.append((trial, None, str(e)))
+        
+        for algorithm_class in self.config.algorithms:
+            # Create algorithm instance up-front for its metadata and to surface init errors
+            try:
+                algorithm = _get_algorithm(algorithm_class)
+            except Exception as e:
+                scenario_plans.append({
+                    'algorithm': algorithm_class.__name__,
+                    'error': f"Failed to initialize: {str(e)}",
+                    'trials': []
+                })
+                continue
+            
+            trials = []
+            
+            for trial, problem, error in problems:
+                if problem is None:
+                    trials.append((trial, None, error))
+                    continue
                 
+                tasks.append((algorithm_class, *problem, self.config.timeout_seconds))
+                trials.append((trial, len(tasks) - 1, None))
+            
+            scenario_plans.append({
+                'algorithm': algorithm.name,
+                'category': algorithm.category.value,
+                'trials': trials
+            })
+        
+        return scenario_plans
+    
+    def _benchmark_algorithm(self, plan: Dict[str, Any], futures: List[Future]) -> Dict[str, Any]:
+        """Collect the trials of a single algorithm and calculate its statistics."""
+        if 'error' in plan:
+            return plan
+        
+        trials = []
+        success_count = 0
+        
+        for trial, task_index, error in plan['trials']:
+            if error is None:
+                # No timeout here: the worker enforces the trial's deadline from
+                # when the trial actually starts, not from when it was queued
                 try:
-                    result = algorithm.find_path(grid, start, goal)
-                    elapsed_time = time.perf_counter() - start_time
-                    
-                    if elapsed_time > self.config.timeout_seconds:
-                        result.found = False
-                        result.error_message = "Timeout exceeded"
-                    
+                    trial_data = futures[task_index].result()
                 except Exception as e:
-                    elapsed_time = time.perf_counter() - start_time
-                    result = PathfindingResult()
-                    result.found = False
-                    result.error_message = str(e)
-                    result.execution_time = elapsed_time
-                
-                # Record trial result
+                    error = str(e)
+            
+            if error is not None:
                 trial_data = {
-                    'trial': trial,
-                    'success': result.found,
-                    'execution_time': result.execution_time,
-                    'path_length': result.path_length,
-                    'nodes_expanded': result.nodes_expanded,
-                    'nodes_visited': result.nodes_visited,
-                    'memory_usage': result.memory_usage,
-                    'algorithm_data': result.algorithm_data,
-                    'error': result.error_message
-                }
-                
-                trials.append(trial_data)
-                
-                if result.found:
-                    success_count += 1
-                
-            except Exception as e:
-                trials.append({
-                    'trial': trial,
                     'success': False,
-                    'error': str(e),
+                    'error': error,
                     'execution_time': 0,
                     'path_length': 0,
                     'nodes_expanded': 0,
                     'nodes_visited': 0,
                     'memory_usage': 0
-                })
-        
-        # Calculate statistics
-        successful_trials = [t for t in trials if t['success']]
-        
-        stats = {
-            'success_rate': success_count / len(trials) if trials else 0,
-            'avg_execution_time': statistics.mean([t['execution_time'] for t in successful_trials]) if successful_trials else 0,
-            'avg_path_length': statistics.mean([t['path_length'] for t in successful_trials]) if successful_trials else 0,
-            'avg_nodes_expanded': statistics.mean([t['nodes_expanded'] for t in successful_trials]) if successful_trials else 0,
-            'avg_nodes_visited': statistics.mean([t['nodes_visited'] for t in successful_trials]) if successful_trials else 0,
-            'avg_memory_usage': statistics.mean([t['memory_usage'] for t in successful_trials]) if successful_trials else 0,
-        }
+                }
+            
+            trials.append({'trial': trial, **trial_data})
+            
+            if trial_data['success']:
+                success_count += 1
         
-        if successful_trials:
-            stats.update({
-                'std_execution_time': statistics.stdev([t['execution_time'] for t in successful_trials]) if len(successful_trials) > 1 else 0,
-                'std_path_length': statistics.stdev([t['path_length'] for t in successful_trials]) if len(successful_trials) > 1 else 0,
-                'min_execution_time': min([t['execution_time'] for t in successful_trials]),
-                'max_execution_time': max([t['execution_time'] for t in successful_trials]),
-            })
+        stats = _trial_statistics(trials, success_count)
         
         return {
-            'algorithm': algorithm.name,
-            'category': algorithm.category.value,
+            'algorithm': plan['algorithm'],
+            'category': plan['category'],
             'statistics': stats,
             'trials': trials
         }
     
+    def _trial_rng(self, grid_size: Tuple[int, int], obstacle_density: float,
+                   scenario: TestScenario, trial: int) -> random.Random:
+        """Random generator for one trial's problem, reproducible when config.seed is set."""
+        if self.config.seed is None:
+            return random.Random()
+        
+        return random.Random(f"{self.config.seed}:{scenario.name}:{grid_size[0]}x{grid_size[1]}:"
+                             f"{obstacle_density}:{trial}")
+    
     def _create_test_grid(self, width: int, height: int, obstacle_density: float, 
-                         scenario: TestScenario) -> Grid:
+                         scenario: TestScenario, rng: Optional[random.Random] = None) -> Grid:
         """Create a test grid based on the scenario."""
         if scenario == TestScenario.OPEN_SPACE:
             grid = Grid(width, height)
-            grid.add_random_obstacles(obstacle_density * 0.5)  # Reduced obstacles for open space
+            grid.add_random_obstacles(obstacle_density * 0.5, rng=rng)  # Reduced obstacles for open space
             
         elif scenario == TestScenario.MAZE_LIKE:
             grid = Grid(width, height)
@@ -246,72 +489,80 @@ class AlgorithmBenchmark:
             
         elif scenario == TestScenario.RANDOM_OBSTACLES:
             grid = Grid(width, height)
-            grid.add_random_obstacles(obstacle_density)
+            grid.add_random_obstacles(obstacle_density, rng=rng)
             
         elif scenario == TestScenario.NARROW_PASSAGES:
             grid = Grid(width, height)
-            # Create narrow passages pattern
-            for y in range(height):
-                for x in range(width):
-                    if x % 8 == 0 or y % 8 == 0:
-                        if not (x % 16 == 8 or y % 16 == 8):  # Leave some passages
-                            grid.set_walkable(x, y, False)
-                            
+            _carve_narrow_passages(grid)
+            
         elif scenario == TestScenario.LARGE_SCALE:
             grid = Grid(max(width, 100), max(height, 100))  # Ensure minimum size
-            grid.add_random_obstacles(obstacle_density)
+            grid.add_random_obstacles(obstacle_density, rng=rng)
             
         else:  # WEIGHTED_TERRAIN or default
             grid = Grid(width, height)
-            grid.add_random_obstacles(obstacle_density)
+            grid.add_random_obstacles(obstacle_density, rng=rng)
         
         return grid
     
-    def _generate_test_positions(self, grid: Grid) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+    def _generate_test_positions(self, grid: Grid, rng: Optional[random.Random] = None
+                                 ) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
         """Generate valid start and goal positions."""
-        walkable_positions = []
+        if rng is None:
+            rng = random
         
-        for y in range(grid.height):
-            for x in range(grid.width):
-                if grid.is_walkable(x, y):
-                    walkable_positions.append((x, y))
+        # One pass over the packed walkability mask instead of a per-cell lookup
+        width = grid.width
+        walkable_positions = [(index % width, index // width)
+                              for index, cell in enumerate(grid.to_walkable_bytes()) if cell]
         
         if len(walkable_positions) < 2:
             return None, None
         
         # Choose positions that are reasonably far apart
-        import random
-        start = random.choice(walkable_positions)
+        start = rng.choice(walkable_positions)
         
-        # Find goal that's at least 1/4 of the grid diagonal away
+        # Find goal that's at least 1/4 of the grid diagonal away; the start is
+        # at distance zero, so it only needs excluding in the fallback
         min_distance = max(grid.width, grid.height) * 0.25
+        sx, sy = start
         valid_goals = [pos for pos in walkable_positions 
-                      if abs(pos[0] - start[0]) + abs(pos[1] - start[1]) >= min_distance]
+                      if abs(pos[0] - sx) + abs(pos[1] - sy) >= min_distance]
         
         if not valid_goals:
-            valid_goals = walkable_positions
+            valid_goals = [pos for pos in walkable_positions if pos != start]
         
-        goal = random.choice([pos for pos in valid_goals if pos != start])
+        goal = rng.choice(valid_goals)
         
         return start, goal
     
     def _analyze_results(self) -> Dict[str, Any]:
-        """Analyze benchmark results to extract insights."""
+        """
+        Analyze benchmark results to extract insights.
+        
+        The analysis is cached until the next benchmark run changes the results.
+        """
+        if self._analysis_cache is not None:
+            return self._analysis_cache
+        
+        rankings = self._rank_algorithms()
+        
         analysis = {
-            'algorithm_rankings': self._rank_algorithms(),
+            'algorithm_rankings': rankings,
             'scenario_analysis': self._analyze_scenarios(),
             'scalability_analysis': self._analyze_scalability(),
-            'recommendations': self._generate_recommendations()
+            'recommendations': self._generate_recommendations(rankings)
         }
         
+        self._analysis_cache = analysis
         return analysis
     
     def _rank_algorithms(self) -> Dict[str, List[str]]:
-        """Rank algorithms by different metrics."""
+        """Rank the top algorithms by different metrics."""
         algorithm_metrics = {}
         
         # Collect metrics for each algorithm
-        for scenario_key, scenario_results in self.results.items():
+        for scenario_results in self.results.values():
             for alg_result in scenario_results:
                 alg_name = alg_result['algorithm']
                 
@@ -331,29 +582,30 @@ class AlgorithmBenchmark:
                 algorithm_metrics[alg_name]['nodes_expanded'].append(stats['avg_nodes_expanded'])
                 algorithm_metrics[alg_name]['memory_usage'].append(stats['avg_memory_usage'])
         
-        # Calculate average metrics and rank
+        # Average each metric once per algorithm, then keep only the leaders
+        scores = {
+            alg_name: (
+                statistics.mean(metrics['success_rates']),
+                _positive_mean(metrics['execution_times']),
+                _positive_mean(metrics['path_lengths']),
+                _positive_mean(metrics['memory_usage'])
+            )
+            for alg_name, metrics in algorithm_metrics.items()
+        }
+        
         rankings = {}
         
         # Rank by success rate
-        success_ranking = sorted(algorithm_metrics.keys(), 
-                               key=lambda x: statistics.mean(algorithm_metrics[x]['success_rates']), 
-                               reverse=True)
-        rankings['success_rate'] = success_ranking
+        rankings['success_rate'] = heapq.nlargest(_RANKING_DEPTH, scores, key=lambda x: scores[x][0])
         
         # Rank by speed (lower is better)
-        speed_ranking = sorted(algorithm_metrics.keys(), 
-                             key=lambda x: statistics.mean([t for t in algorithm_metrics[x]['execution_times'] if t > 0]) or float('inf'))
-        rankings['speed'] = speed_ranking
+        rankings['speed'] = heapq.nsmallest(_RANKING_DEPTH, scores, key=lambda x: scores[x][1])
         
         # Rank by path quality (lower length is better)
-        quality_ranking = sorted(algorithm_metrics.keys(), 
-                               key=lambda x: statistics.mean([l for l in algorithm_metrics[x]['path_lengths'] if l > 0]) or float('inf'))
-        rankings['path_quality'] = quality_ranking
+        rankings['path_quality'] = heapq.nsmallest(_RANKING_DEPTH, scores, key=lambda x: scores[x][2])
         
         # Rank by memory efficiency (lower is better)
-        memory_ranking = sorted(algorithm_metrics.keys(), 
-                              key=lambda x: statistics.mean([m for m in algorithm_metrics[x]['memory_usage'] if m > 0]) or float('inf'))
-        rankings['memory_efficiency'] = memory_ranking
+        rankings['memory_efficiency'] = heapq.nsmallest(_RANKING_DEPTH, scores, key=lambda x: scores[x][3])
         
         return rankings
     
@@ -361,12 +613,13 @@ class AlgorithmBenchmark:
         """Analyze which algorithms perform best in each scenario type."""
         scenario_analysis = {}
         
+        # Group results by scenario in a single pass
+        scenario_groups = defaultdict(list)
+        for (scenario_name, _, _), results in self.results.items():
+            scenario_groups[scenario_name].extend(results)
+        
         for scenario in TestScenario:
-            scenario_results = []
-            
-            for scenario_key, results in self.results.items():
-                if scenario.value in scenario_key:
-                    scenario_results.extend(results)
+            scenario_results = scenario_groups.get(scenario.value)
             
             if scenario_results:
                 # Find best performing algorithm for this scenario
@@ -388,20 +641,12 @@ class AlgorithmBenchmark:
         scalability = {}
         
         # Group results by grid size
-        size_groups = {}
-        for scenario_key, results in self.results.items():
-            # Extract grid size from scenario key
-            parts = scenario_key.split('_')
-            if len(parts) >= 2:
-                grid_size = parts[1]  # e.g., "50x50"
-                
-                if grid_size not in size_groups:
-                    size_groups[grid_size] = []
-                
-                size_groups[grid_size].extend(results)
+        size_groups = defaultdict(list)
+        for (_, grid_size, _), results in self.results.items():
+            size_groups[grid_size].extend(results)
         
         # Analyze scaling for each algorithm
-        for grid_size, results in size_groups.items():
+        for (width, height), results in size_groups.items():
             alg_performance = {}
             
             for result in results:
@@ -411,16 +656,14 @@ class AlgorithmBenchmark:
                 
                 alg_performance[alg_name].append(result['statistics']['avg_execution_time'])
             
-            scalability[grid_size] = {
+            scalability[f"{width}x{height}"] = {
                 alg: statistics.mean(times) for alg, times in alg_performance.items()
             }
         
         return scalability
     
-    def _generate_recommendations(self) -> Dict[str, str]:
-        """Generate algorithm recommendations for different use cases."""
-        rankings = self._rank_algorithms()
-        
+    def _generate_recommendations(self, rankings: Dict[str, List[str]]) -> Dict[str, str]:
+        """Generate algorithm recommendations for different use cases from the rankings."""
         recommendations = {
             'general_purpose': rankings['success_rate'][0] if rankings['success_rate'] else 'A*',
             'speed_critical': rankings['speed'][0] if rankings['speed'] else 'Dijkstra',
@@ -462,22 +705,62 @@ class AlgorithmBenchmark:
             'num_trials': self.config.num_trials,
             'scenarios': [s.value for s in self.config.scenarios],
             'algorithms': [alg.__name__ for alg in self.config.algorithms],
-            'timeout_seconds': self.config.timeout_seconds
+            'timeout_seconds': self.config.timeout_seconds,
+            'max_workers': self.config.max_workers,
+            'seed': self.config.seed
         }
     
-    def save_results(self, filepath: str):
-        """Save benchmark results to JSON file."""
-        results_data = {
-            'config': self._config_to_dict(),
-            'results': self.results,
-            'analysis': self._analyze_results(),
-            'summary': self._create_summary()
-        }
+    def save_results(self, filepath: str, include_trials: bool = False):
+        """
+        Save benchmark results to JSON file.
+        
+        The document is written piece by piece, one scenario at a time, so the
+        raw trial data is never assembled into a single combined structure.
+        Entries are written compactly, one per line.
         
-        with open(filepath, 'w') as f:
-            json.dump(results_data, f, indent=2)
+        Args:
+            filepath: Path of the JSON file to write
+            include_trials: Also write every individual trial, one JSON object
+                per line, to ``<filepath>.trials.jsonl.gz``. The JSON file
+                itself only keeps per-algorithm statistics.
+        """
+        trials_file = gzip.open(f"{filepath}.trials.jsonl.gz", 'wt') if include_trials else None
+        
+        try:
+            with open(filepath, 'w') as f:
+                f.write('{\n  "config": ')
+                json.dump(self._config_to_dict(), f)
+                f.write(',\n  "results": {')
+                
+                separator = '\n'
+                for key, results in self.results.items():
+                    scenario_name = _scenario_key_to_str(key)
+                    
+                    f.write(separator)
+                    f.write(f'    {json.dumps(scenario_name)}: ')
+                    json.dump([{**result, 'trials': []} for result in results], f)
+                    separator = ',\n'
+                    
+                    if trials_file is not None:
+                        for result in results:
+                            for trial in result['trials']:
+                                trials_file.write(json.dumps({'scenario': scenario_name,
+                                                              'algorithm': result['algorithm'],
+                                                              **trial}))
+                                trials_file.write('\n')
+                
+                f.write('\n  },\n  "analysis": ')
+                json.dump(self._analyze_results(), f)
+                f.write(',\n  "summary": ')
+                json.dump(self._create_summary(), f)
+                f.write('\n}\n')
+        finally:
+            if trials_file is not None:
+                trials_file.close()
         
         print(f"Results saved to {filepath}")
+        if include_trials:
+            print(f"Trials saved to {filepath}.trials.jsonl.gz")
     
     def print_summary(self):
         """Print a formatted summary of the results."""
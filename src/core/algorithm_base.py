@@ -4,7 +4,9 @@ Defines common structure and contracts for all pathfinding implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Callable, Iterator
+import itertools
+import math
 import time
 from enum import Enum
 
@@ -12,6 +14,14 @@ from .grid import Grid
 from .node import GridNode
 
 
+# Node distance functions by heuristic name; unknown names fall back to Euclidean
+_HEURISTIC_FUNCTIONS = {
+    "manhattan": GridNode.manhattan_distance,
+    "euclidean": GridNode.euclidean_distance,
+    "diagonal": GridNode.diagonal_distance,
+}
+
+
 class AlgorithmCategory(Enum):
     """Categories of pathfinding algorithms."""
     CLASSICAL = "Classical"
@@ -27,7 +37,15 @@ class PathfindingResult:
     Contains path, performance metrics, and algorithm-specific data.
     """
     
+    __slots__ = ('path', 'path_length', 'path_cost', 'execution_time', 'nodes_expanded',
+                 'nodes_visited', 'memory_usage', 'found', 'iterations', 'max_open_set_size',
+                 'algorithm_data', 'error_message')
+    
     def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Reset every field to its initial value so the result can be reused."""
         # Path information
         self.path: List[Tuple[float, float]] = []
         self.path_length: float = 0.0
@@ -56,14 +74,9 @@ class PathfindingResult:
             self.path_length = 0.0
             return
         
-        total_length = 0.0
-        for i in range(1, len(self.path)):
-            x1, y1 = self.path[i-1]
-            x2, y2 = self.path[i]
-            dx, dy = x2 - x1, y2 - y1
-            total_length += (dx * dx + dy * dy) ** 0.5
-        
-        self.path_length = total_length
+        # math.dist measures each segment in C; map pairs consecutive points
+        path = self.path
+        self.path_length = sum(map(math.dist, path, path[1:]))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary for serialization."""
@@ -93,12 +106,28 @@ class PathfindingAlgorithm(ABC):
         self.name = name
         self.category = category
         
+        # Opt-in result reuse: when set, every search fills in this object
+        # instead of allocating a new one, so a result is only valid until
+        # the next search on this instance
+        self.result_buffer: Optional[PathfindingResult] = None
+        
         # Performance tracking
         self._start_time: float = 0.0
         self._nodes_expanded: int = 0
         self._nodes_visited: int = 0
         self._max_memory: int = 0
         self._iterations: int = 0
+        
+        # Heap tie-breaker: open-set entries are (priority, next(self._counter), node)
+        # so equal priorities are settled by insertion order, never by comparing nodes
+        self._counter: Iterator[int] = itertools.count()
+        
+        # Per-search heuristic memo for one goal, keyed by flat node index
+        self._heuristic_cache: Dict[int, float] = {}
+        self._heuristic_goal: Optional[GridNode] = None
+        self._heuristic_type: Optional[str] = None
+        self._heuristic_fn: Callable[[GridNode, GridNode], float] = GridNode.euclidean_distance
+        self._heuristic_width: int = 0
     
     @abstractmethod
     def find_path(self, grid: Grid, start: Tuple[int, int], goal: Tuple[int, int]) -> PathfindingResult:
@@ -115,6 +144,20 @@ class PathfindingAlgorithm(ABC):
         """
         pass
     
+    def reset(self):
+        """
+        Clear per-search state so the instance can be reused for another search.
+        
+        Subclasses that keep state between searches should extend this.
+        """
+        self._start_time = 0.0
+        self._nodes_expanded = 0
+        self._nodes_visited = 0
+        self._max_memory = 0
+        self._iterations = 0
+        self._counter = itertools.count()
+        self._clear_heuristic_cache()
+    
     def _start_timing(self):
         """Start performance timing."""
         self._start_time = time.perf_counter()
@@ -122,11 +165,38 @@ class PathfindingAlgorithm(ABC):
         self._nodes_visited = 0
         self._max_memory = 0
         self._iterations = 0
+        self._counter = itertools.count()
+        self._clear_heuristic_cache()
+    
+    def _init_search(self, grid: Grid, goal_node: GridNode, heuristic_type: str = "euclidean"):
+        """
+        Prepare per-search state once the goal is known.
+        
+        Enables memoization of get_heuristic for ``goal_node`` and
+        ``heuristic_type``: each node's heuristic is computed the first time
+        it is requested and reused for the rest of the search. The distance
+        function is resolved here once rather than on every call.
+        """
+        self._heuristic_cache = {}
+        self._heuristic_goal = goal_node
+        self._heuristic_type = heuristic_type
+        self._heuristic_fn = _HEURISTIC_FUNCTIONS.get(heuristic_type, GridNode.euclidean_distance)
+        self._heuristic_width = grid.width
+    
+    def _clear_heuristic_cache(self):
+        """Drop the heuristic memo of the previous search."""
+        self._heuristic_cache = {}
+        self._heuristic_goal = None
+        self._heuristic_type = None
     
     def _create_result(self, path: List[Tuple[float, float]], found: bool, 
                       error_message: Optional[str] = None) -> PathfindingResult:
-        """Create a PathfindingResult with current metrics."""
-        result = PathfindingResult()
+        """Create a PathfindingResult with current metrics, reusing result_buffer if set."""
+        result = self.result_buffer
+        if result is None:
+            result = PathfindingResult()
+        else:
+            result.reset()
         
         # Set path information
         result.path = path
@@ -173,14 +243,14 @@ class PathfindingAlgorithm(ABC):
         Returns:
             Heuristic distance
         """
-        if heuristic_type == "manhattan":
-            return node.manhattan_distance(goal_node)
-        elif heuristic_type == "euclidean":
-            return node.euclidean_distance(goal_node)
-        elif heuristic_type == "diagonal":
-            return node.diagonal_distance(goal_node)
-        else:
-            return node.euclidean_distance(goal_node)
+        if goal_node is self._heuristic_goal and heuristic_type == self._heuristic_type:
+            index = node.y * self._heuristic_width + node.x
+            h = self._heuristic_cache.get(index)
+            if h is None:
+                h = self._heuristic_cache[index] = self._heuristic_fn(node, goal_node)
+            return h
+        
+        return _HEURISTIC_FUNCTIONS.get(heuristic_type, GridNode.euclidean_distance)(node, goal_node)
     
     def validate_inputs(self, grid: Grid, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[str]:
         """
@@ -189,18 +259,23 @@ class PathfindingAlgorithm(ABC):
         Returns:
             Error message if validation fails, None otherwise
         """
+        width, height = grid.width, grid.height
+        start_x, start_y = start
+        goal_x, goal_y = goal
+        
         # Check if positions are valid
-        if not grid.is_valid_position(start[0], start[1]):
+        if not (0 <= start_x < width and 0 <= start_y < height):
             return f"Start position {start} is outside grid bounds"
         
-        if not grid.is_valid_position(goal[0], goal[1]):
+        if not (0 <= goal_x < width and 0 <= goal_y < height):
             return f"Goal position {goal} is outside grid bounds"
         
-        # Check if positions are walkable
-        if not grid.is_walkable(start[0], start[1]):
+        # Check if positions are walkable, straight from the mask
+        walkable = grid.walkable
+        if not walkable[start_y * width + start_x]:
             return f"Start position {start} is not walkable"
         
-        if not grid.is_walkable(goal[0], goal[1]):
+        if not walkable[goal_y * width + goal_x]:
             return f"Goal position {goal} is not walkable"
         
         return None
@@ -237,4 +312,4 @@ class HeuristicFunction:
         """Octile distance heuristic (combination of diagonal and straight)."""
         dx = abs(x1 - x2)
         dy = abs(y1 - y2)
-        return (dx + dy) + ((2 ** 0.5) - 2) * min(dx, dy)
\ No newline at end of file
+        return (dx + dy) + ((2 ** 0.5) - 2) * min(dx, dy)
@@ -3,16 +3,30 @@ Grid representation for pathfinding algorithms.
 Provides various grid types and utilities for different pathfinding scenarios.
 """
 
-from typing import List, Tuple, Optional, Set, Callable
+from typing import List, Tuple, Optional, Set, Callable, Dict
 import random
 import math
 from .node import GridNode, AngleNode, DynamicNode
+from .grid_astar import grid_astar
+
+
+# Movement directions: 4-directional first, then the diagonals for 8-directional
+_STRAIGHT_DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+_ALL_DIRECTIONS = _STRAIGHT_DIRECTIONS + ((1, 1), (1, -1), (-1, 1), (-1, -1))
 
 
 class Grid:
     """
     Basic grid for pathfinding algorithms.
     Supports rectangular grids with obstacles.
+    
+    Walkability is stored in ``walkable``, a flat row-major byte mask
+    (1 = walkable) that every walkability query reads. Node objects are
+    only created when a cell is first requested through ``get_node`` (or
+    returned by ``get_neighbors``), so building a grid is cheap and memory
+    grows with the cells a search actually touches. Nodes mirror the mask
+    in their ``walkable`` attribute; change it through ``set_walkable`` so
+    the two stay in sync.
     """
     
     def __init__(self, width: int, height: int, node_class=GridNode):
@@ -20,8 +34,11 @@ class Grid:
         self.height = height
         self.node_class = node_class
         
-        # Initialize grid
-        self.nodes: List[List[GridNode]] = []
+        # Walkability mask, one byte per cell at index y * width + x
+        self.walkable = bytearray(b'\x01') * (width * height)
+        
+        # Nodes created so far, keyed by flat index
+        self._node_cache: Dict[int, GridNode] = {}
         self._initialize_grid()
         
         # Movement patterns
@@ -30,19 +47,28 @@ class Grid:
         self.straight_cost = 1.0
     
     def _initialize_grid(self):
-        """Initialize the grid with nodes."""
-        self.nodes = []
-        for y in range(self.height):
-            row = []
-            for x in range(self.width):
-                row.append(self.node_class(x, y, walkable=True))
-            self.nodes.append(row)
+        """Initialize the grid; nodes are created lazily by get_node."""
+        self._node_cache = {}
+    
+    def all_nodes(self) -> List[List[GridNode]]:
+        """
+        Get all nodes as rows of the grid.
+        
+        Builds a fresh width x height list on each call and creates every node
+        not yet created, so prefer get_node for individual cells.
+        """
+        return [[self.get_node(x, y) for x in range(self.width)] for y in range(self.height)]
     
     def get_node(self, x: int, y: int) -> Optional[GridNode]:
         """Get node at position (x, y)."""
-        if self.is_valid_position(x, y):
-            return self.nodes[y][x]
-        return None
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        
+        index = y * self.width + x
+        node = self._node_cache.get(index)
+        if node is None:
+            node = self._node_cache[index] = self.node_class(x, y, walkable=self.walkable[index] != 0)
+        return node
     
     def is_valid_position(self, x: int, y: int) -> bool:
         """Check if position is within grid bounds."""
@@ -50,31 +76,37 @@ class Grid:
     
     def is_walkable(self, x: int, y: int) -> bool:
         """Check if position is walkable."""
-        node = self.get_node(x, y)
-        return node is not None and node.walkable
+        return 0 <= x < self.width and 0 <= y < self.height and self.walkable[y * self.width + x] != 0
     
     def set_walkable(self, x: int, y: int, walkable: bool):
         """Set walkable status of a position."""
-        node = self.get_node(x, y)
-        if node:
-            node.walkable = walkable
+        if self.is_valid_position(x, y):
+            index = y * self.width + x
+            self.walkable[index] = 1 if walkable else 0
+            
+            node = self._node_cache.get(index)
+            if node is not None:
+                node.walkable = walkable
     
     def get_neighbors(self, node: GridNode) -> List[GridNode]:
         """Get walkable neighbors of a node."""
-        neighbors = []
-        
-        # Define movement directions
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # 4-directional
-        
-        if self.diagonal_movement:
-            directions.extend([(1, 1), (1, -1), (-1, 1), (-1, -1)])  # 8-directional
+        directions = _ALL_DIRECTIONS if self.diagonal_movement else _STRAIGHT_DIRECTIONS
+        width = self.width
+        height = self.height
+        walkable = self.walkable
+        node_cache = self._node_cache
+        x, y = node.x, node.y
         
+        neighbors = []
         for dx, dy in directions:
-            new_x, new_y = node.x + dx, node.y + dy
+            new_x, new_y = x + dx, y + dy
             
-            if self.is_walkable(new_x, new_y):
-                neighbor = self.get_node(new_x, new_y)
-                if neighbor:
+            if 0 <= new_x < width and 0 <= new_y < height:
+                index = new_y * width + new_x
+                if walkable[index]:
+                    neighbor = node_cache.get(index)
+                    if neighbor is None:
+                        neighbor = node_cache[index] = self.node_class(new_x, new_y, walkable=True)
                     neighbors.append(neighbor)
         
         return neighbors
@@ -96,50 +128,118 @@ class Grid:
     
     def reset_pathfinding_data(self):
         """Reset all pathfinding data for nodes."""
-        for row in self.nodes:
-            for node in row:
-                node.reset()
+        # Nodes that were never created still hold their initial state
+        for node in self._node_cache.values():
+            node.reset()
     
-    def add_random_obstacles(self, obstacle_percentage: float = 0.2, seed: Optional[int] = None):
-        """Add random obstacles to the grid."""
-        if seed is not None:
-            random.seed(seed)
+    def add_random_obstacles(self, obstacle_percentage: float = 0.2, seed: Optional[int] = None,
+                             rng: Optional[random.Random] = None):
+        """
+        Add random obstacles to the grid.
+        
+        Chooses exactly ``int(total * obstacle_percentage)`` distinct cells
+        from the whole grid and blocks them. Cells that are already blocked
+        may be chosen, so on a grid with walls fewer new cells get blocked.
+        Draws from ``rng`` when given, otherwise from the global ``random``
+        module (reseeded with ``seed`` if provided).
+        """
+        if rng is None:
+            if seed is not None:
+                random.seed(seed)
+            rng = random
         
         total_nodes = self.width * self.height
-        num_obstacles = int(total_nodes * obstacle_percentage)
+        num_obstacles = max(0, min(int(total_nodes * obstacle_percentage), total_nodes))
+        
+        # Write straight into the mask; only already-created nodes need syncing
+        walkable = self.walkable
+        node_cache = self._node_cache
         
-        for _ in range(num_obstacles):
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            self.set_walkable(x, y, False)
+        for index in rng.sample(range(total_nodes), num_obstacles):
+            walkable[index] = 0
+            node = node_cache.get(index)
+            if node is not None:
+                node.walkable = False
     
     def add_maze_pattern(self):
-        """Add a maze-like pattern of obstacles."""
+        """
+        Add a maze-like pattern of obstacles.
+        
+        Walls cover every row and column whose index is a multiple of 4. The
+        odd/odd pathway cells can never lie on such a line, so whole rows and
+        every 4th cell of the other rows are cleared as slices of the mask.
+        """
+        width = self.width
+        walkable = self.walkable
+        full_wall = bytes(width)
+        column_walls = bytes(len(range(0, width, 4)))
+        
         # Create maze walls
         for y in range(self.height):
-            for x in range(self.width):
-                # Create maze pattern
-                if x % 2 == 1 and y % 2 == 1:
-                    continue  # Keep pathways
-                if x % 4 == 0 or y % 4 == 0:
-                    self.set_walkable(x, y, False)
+            offset = y * width
+            if y % 4 == 0:
+                walkable[offset:offset + width] = full_wall
+            else:
+                walkable[offset:offset + width:4] = column_walls
+        
+        for node in self._node_cache.values():
+            if node.x % 4 == 0 or node.y % 4 == 0:
+                node.walkable = False
     
     def clear_obstacles(self):
         """Remove all obstacles from the grid."""
-        for row in self.nodes:
-            for node in row:
-                node.walkable = True
+        self.walkable[:] = b'\x01' * len(self.walkable)
+        for node in self._node_cache.values():
+            node.walkable = True
+    
+    def to_walkable_bytes(self) -> bytes:
+        """Pack walkability into one byte per cell, row-major (1 = walkable)."""
+        return bytes(self.walkable)
+    
+    @classmethod
+    def from_walkable_bytes(cls, width: int, height: int, data: bytes) -> 'Grid':
+        """Rebuild a grid from the output of to_walkable_bytes."""
+        grid = cls(width, height)
+        grid.load_walkable_bytes(data)
+        return grid
+    
+    def load_walkable_bytes(self, data: bytes):
+        """Replace walkability with the output of to_walkable_bytes and drop created nodes."""
+        if len(data) != self.width * self.height:
+            raise ValueError(f"Expected {self.width * self.height} bytes for a {self.width}x{self.height} grid, got {len(data)}")
+        self.walkable[:] = data
+        self._initialize_grid()
     
     def get_path(self, goal_node: GridNode) -> List[Tuple[int, int]]:
         """Reconstruct path from goal node to start."""
         path = []
+        append = path.append
         current = goal_node
         
         while current is not None:
-            path.append((current.x, current.y))
+            append((current.x, current.y))
             current = current.parent
         
-        return list(reversed(path))
+        # Reverse in place rather than copying through reversed()
+        path.reverse()
+        return path
+    
+    def find_path_fast(self, start: Tuple[int, int], goal: Tuple[int, int],
+                       heuristic_type: str = "euclidean") -> List[Tuple[int, int]]:
+        """
+        Find an A* path directly on the walkable mask.
+        
+        Skips node objects and per-search bookkeeping entirely; use a
+        PathfindingAlgorithm for search statistics.
+        Returns an empty list if either endpoint is blocked or no path exists.
+        """
+        if not (self.is_walkable(*start) and self.is_walkable(*goal)):
+            return []
+        
+        path, _ = grid_astar(self.walkable, self.width, self.height, start, goal,
+                             self.diagonal_movement, self.straight_cost,
+                             self.diagonal_cost, heuristic_type)
+        return path
     
     def __repr__(self):
         return f"Grid({self.width}x{self.height}, diagonal={self.diagonal_movement})"
@@ -173,9 +273,14 @@ class AngleGrid(Grid):
         x, y = ix1, iy1
         error = dx - dy
         
+        # Read the walkable mask directly; this is the hottest loop of any-angle search
+        width = self.width
+        height = self.height
+        walkable = self.walkable
+        
         while True:
             # Check current position
-            if not self.is_walkable(x, y):
+            if not (0 <= x < width and 0 <= y < height and walkable[y * width + x]):
                 return False
             
             if x == ix2 and y == iy2:
@@ -208,7 +313,8 @@ class AngleGrid(Grid):
             
             current = current.parent
         
-        return list(reversed(path))
+        path.reverse()
+        return path
 
 
 class DynamicGrid(Grid):
@@ -221,31 +327,43 @@ class DynamicGrid(Grid):
         super().__init__(width, height, DynamicNode)
         self.update_counter = 0
     
+    def _initialize_grid(self):
+        """Initialize the grid; dropping the created nodes also drops their recorded changes."""
+        super()._initialize_grid()
+        
+        # Flat indices of nodes changed since the flags were last cleared
+        self._dirty: Set[int] = set()
+    
     def update_node_cost(self, x: int, y: int, walkable: bool):
         """Update node cost and mark for replanning."""
         node = self.get_node(x, y)
         if node and isinstance(node, DynamicNode):
             if node.walkable != walkable:
-                node.walkable = walkable
+                self.set_walkable(x, y, walkable)
                 node.cost_changed = True
                 node.last_updated = self.update_counter
                 self.update_counter += 1
+                self._dirty.add(y * self.width + x)
     
     def get_changed_nodes(self) -> List[DynamicNode]:
-        """Get list of nodes that have changed since last planning."""
+        """
+        Get list of nodes that have changed since last planning.
+        
+        Only the recorded changes are visited, in row-major order; nodes
+        whose flag was reset in the meantime are skipped.
+        """
         changed = []
-        for row in self.nodes:
-            for node in row:
-                if isinstance(node, DynamicNode) and node.cost_changed:
-                    changed.append(node)
+        for index in sorted(self._dirty):
+            node = self._node_cache[index]
+            if node.cost_changed:
+                changed.append(node)
         return changed
     
     def clear_change_flags(self):
         """Clear all change flags."""
-        for row in self.nodes:
-            for node in row:
-                if isinstance(node, DynamicNode):
-                    node.cost_changed = False
+        for index in self._dirty:
+            self._node_cache[index].cost_changed = False
+        self._dirty.clear()
 
 
 class WeightedGrid(Grid):
@@ -268,6 +386,10 @@ class WeightedGrid(Grid):
         
         # Terrain type for each cell
         self.terrain: List[List[str]] = []
+        
+        # Numeric terrain cost per cell, flat row-major like the walkable mask,
+        # so edge costs need no TERRAIN_COSTS lookup
+        self._terrain_cost: List[float] = []
         self._initialize_terrain()
     
     def _initialize_terrain(self):
@@ -278,22 +400,24 @@ class WeightedGrid(Grid):
             for x in range(self.width):
                 row.append('grass')  # Default terrain
             self.terrain.append(row)
+        
+        self._terrain_cost = [self.TERRAIN_COSTS['grass']] * (self.width * self.height)
     
     def set_terrain(self, x: int, y: int, terrain_type: str):
         """Set terrain type for a position."""
         if self.is_valid_position(x, y):
             self.terrain[y][x] = terrain_type
             
-            # Update walkability
+            # Update cost and walkability
             cost = self.TERRAIN_COSTS.get(terrain_type, 1.0)
+            self._terrain_cost[y * self.width + x] = cost
             walkable = cost != float('inf')
             self.set_walkable(x, y, walkable)
     
     def get_terrain_cost(self, x: int, y: int) -> float:
         """Get terrain cost for a position."""
         if self.is_valid_position(x, y):
-            terrain_type = self.terrain[y][x]
-            return self.TERRAIN_COSTS.get(terrain_type, 1.0)
+            return self._terrain_cost[y * self.width + x]
         return float('inf')
     
     def get_movement_cost(self, from_node: GridNode, to_node: GridNode) -> float:
@@ -304,8 +428,20 @@ class WeightedGrid(Grid):
             return base_cost
         
         # Average terrain cost of both nodes
-        from_terrain = self.get_terrain_cost(from_node.x, from_node.y)
-        to_terrain = self.get_terrain_cost(to_node.x, to_node.y)
-        terrain_cost = (from_terrain + to_terrain) / 2
+        width = self.width
+        terrain_cost = self._terrain_cost
+        from_terrain = terrain_cost[from_node.y * width + from_node.x]
+        to_terrain = terrain_cost[to_node.y * width + to_node.x]
+        
+        return base_cost * ((from_terrain + to_terrain) / 2)
+    
+    def find_path_fast(self, start: Tuple[int, int], goal: Tuple[int, int],
+                       heuristic_type: str = "euclidean") -> List[Tuple[int, int]]:
+        """Find a terrain-weighted A* path directly on the walkable mask and terrain costs."""
+        if not (self.is_walkable(*start) and self.is_walkable(*goal)):
+            return []
         
-        return base_cost * terrain_cost
\ No newline at end of file
+        path, _ = grid_astar(self.walkable, self.width, self.height, start, goal,
+                             self.diagonal_movement, self.straight_cost,
+                             self.diagonal_cost, heuristic_type, self._terrain_cost)
+        return path
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""
+Flat-array A* kernel for uniform-cost grids.
+Runs the canonical grid A* loop directly on a walkable mask, without node objects.
+"""
+
+from array import array
+from heapq import heappush, heappop
+from typing import List, Optional, Sequence, Tuple
+import math
+
+
+def _manhattan(dx: int, dy: int) -> float:
+    return abs(dx) + abs(dy)
+
+
+def _diagonal(dx: int, dy: int) -> float:
+    return max(abs(dx), abs(dy))
+
+
+# Heuristics on the offset to the goal; unknown names fall back to Euclidean
+_HEURISTICS = {
+    "manhattan": _manhattan,
+    "euclidean": math.hypot,
+    "diagonal": _diagonal,
+}
+
+# Integer cost units per unit of float cost, used on uniform-cost grids
+COST_SCALE = 10000
+
+# Larger than any reachable g cost in cost units
+_UNREACHED = 2 ** 62
+
+
+def _manhattan_i(dx: int, dy: int) -> int:
+    return (abs(dx) + abs(dy)) * COST_SCALE
+
+
+def _diagonal_i(dx: int, dy: int) -> int:
+    return max(abs(dx), abs(dy)) * COST_SCALE
+
+
+def _euclidean_i(dx: int, dy: int) -> int:
+    # Round down so the heuristic stays admissible
+    return int(math.hypot(dx, dy) * COST_SCALE)
+
+
+_INT_HEURISTICS = {
+    "manhattan": _manhattan_i,
+    "euclidean": _euclidean_i,
+    "diagonal": _diagonal_i,
+}
+
+
+def _to_cost_units(cost: float) -> int:
+    # Round step costs up so every path costs at least its scaled float cost
+    # and the rounded-down heuristics stay admissible
+    return math.ceil(cost * COST_SCALE)
+
+
+def grid_astar(walkable, width: int, height: int,
+               start: Tuple[int, int], goal: Tuple[int, int],
+               diagonal_movement: bool = True, straight_cost: float = 1.0,
+               diagonal_cost: float = math.sqrt(2),
+               heuristic_type: str = "euclidean",
+               cell_costs: Optional[Sequence[float]] = None) -> Tuple[List[Tuple[int, int]], int]:
+    """
+    Find a path with A* over a flat row-major walkable mask.
+    
+    Per-cell search state lives in flat arrays indexed by y * width + x, and
+    heap entries carry an insertion counter so ties never compare cells.
+    Start and goal are assumed to be in bounds and walkable.
+    
+    Without ``cell_costs`` g and f are kept as ints in COST_SCALE units per
+    unit of cost, so the heap only compares integers. With ``cell_costs``
+    each step costs its straight or diagonal cost times the mean cost of the
+    two cells, as in WeightedGrid.get_movement_cost, and costs stay floats.
+    
+    Args:
+        walkable: Row-major mask, one truthy/falsy entry per cell
+        width: Grid width
+        height: Grid height
+        start: Starting position (x, y)
+        goal: Goal position (x, y)
+        diagonal_movement: Allow 8-directional movement
+        straight_cost: Cost of a horizontal or vertical step
+        diagonal_cost: Cost of a diagonal step
+        heuristic_type: "manhattan", "euclidean" or "diagonal"
+        cell_costs: Optional row-major cost multiplier per cell
+    
+    Returns:
+        The path from start to goal (empty if none exists) and the number of
+        expanded cells
+    """
+    sx, sy = start
+    gx, gy = goal
+    start_index = sy * width + sx
+    goal_index = gy * width + gx
+    
+    if start_index == goal_index:
+        return [start], 0
+    
+    if cell_costs is None:
+        heuristic = _INT_HEURISTICS.get(heuristic_type, _euclidean_i)
+        straight_cost = _to_cost_units(straight_cost)
+        diagonal_cost = _to_cost_units(diagonal_cost)
+    else:
+        heuristic = _HEURISTICS.get(heuristic_type, math.hypot)
+        
+        # Scale the heuristic down if any cell is cheaper than a plain step,
+        # so it never overestimates
+        cheapest = min(cell_costs)
+        if cheapest < 1.0:
+            base_heuristic = heuristic
+            heuristic = lambda dx, dy: base_heuristic(dx, dy) * cheapest
+    
+    # (dx, dy, flat index offset, step cost) for each allowed move
+    moves = [(0, 1, width, straight_cost), (1, 0, 1, straight_cost),
+             (0, -1, -width, straight_cost), (-1, 0, -1, straight_cost)]
+    if diagonal_movement:
+        moves += [(1, 1, width + 1, diagonal_cost), (1, -1, 1 - width, diagonal_cost),
+                  (-1, 1, width - 1, diagonal_cost), (-1, -1, -width - 1, diagonal_cost)]
+    
+    size = width * height
+    if cell_costs is None:
+        g_cost = array('q', [_UNREACHED]) * size
+    else:
+        g_cost = array('d', [math.inf]) * size
+    parent = array('l', [-1]) * size
+    closed = bytearray(size)
+    
+    g_cost[start_index] = 0
+    open_set = [(heuristic(gx - sx, gy - sy), 0, start_index)]
+    counter = 0
+    nodes_expanded = 0
+    
+    while open_set:
+        _, _, index = heappop(open_set)
+        
+        # Skip stale entries left behind by later improvements
+        if closed[index]:
+            continue
+        
+        if index == goal_index:
+            path = []
+            while index != -1:
+                path.append((index % width, index // width))
+                index = parent[index]
+            path.reverse()
+            return path, nodes_expanded
+        
+        closed[index] = 1
+        nodes_expanded += 1
+        
+        y, x = divmod(index, width)
+        current_g = g_cost[index]
+        
+        for dx, dy, offset, cost in moves:
+            nx = x + dx
+            ny = y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            
+            neighbor = index + offset
+            if not walkable[neighbor] or closed[neighbor]:
+                continue
+            
+            if cell_costs is None:
+                tentative_g = current_g + cost
+            else:
+                tentative_g = current_g + cost * ((cell_costs[index] + cell_costs[neighbor]) / 2)
+            if tentative_g < g_cost[neighbor]:
+                g_cost[neighbor] = tentative_g
+                parent[neighbor] = index
+                counter += 1
+                heappush(open_set, (tentative_g + heuristic(gx - nx, gy - ny), counter, neighbor))
+    
+    return [], nodes_expanded
@@ -13,6 +13,10 @@ class GridNode:
     Represents a position in a discrete grid.
     """
     
+    # Grids hold one node per cell, so skip the per-instance __dict__
+    __slots__ = ('x', 'y', 'walkable', 'g_cost', 'h_cost', 'f_cost', 'parent',
+                 'visited', 'in_open_set')
+    
     def __init__(self, x: int, y: int, walkable: bool = True):
         self.x = x
         self.y = y
@@ -80,6 +84,8 @@ class AngleNode(GridNode):
     Supports line-of-sight checks and parent coordinates.
     """
     
+    __slots__ = ('parent_x', 'parent_y')
+    
     def __init__(self, x: int, y: int, walkable: bool = True):
         super().__init__(x, y, walkable)
         self.parent_x: Optional[float] = None
@@ -109,6 +115,8 @@ class DynamicNode(GridNode):
     Includes additional properties for incremental search.
     """
     
+    __slots__ = ('rhs', 'key', 'in_queue', 'cost_changed', 'last_updated')
+    
     def __init__(self, x: int, y: int, walkable: bool = True):
         super().__init__(x, y, walkable)
         
@@ -148,12 +156,15 @@ class SamplingNode:
     Represents a point in continuous space.
     """
     
+    __slots__ = ('x', 'y', 'parent', 'children', 'cost', '_hash')
+    
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
         self.parent: Optional['SamplingNode'] = None
         self.children: Set['SamplingNode'] = set()
         self.cost = 0.0
+        self._hash: Optional[int] = None
     
     @property
     def position(self) -> Tuple[float, float]:
@@ -166,6 +177,12 @@ class SamplingNode:
         dy = self.y - other.y
         return math.sqrt(dx * dx + dy * dy)
     
+    def distance_to_sq(self, other: 'SamplingNode') -> float:
+        """Calculate squared Euclidean distance, for comparisons that only need ordering."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+    
     def add_child(self, child: 'SamplingNode'):
         """Add a child node."""
         self.children.add(child)
@@ -184,7 +201,8 @@ class SamplingNode:
         while current is not None:
             path.append(current)
             current = current.parent
-        return list(reversed(path))
+        path.reverse()
+        return path
     
     def __eq__(self, other):
         """Node equality based on position with tolerance."""
@@ -193,8 +211,15 @@ class SamplingNode:
         return abs(self.x - other.x) < 1e-6 and abs(self.y - other.y) < 1e-6
     
     def __hash__(self):
-        """Hash based on rounded position."""
-        return hash((round(self.x, 6), round(self.y, 6)))
+        """
+        Hash based on rounded position.
+        
+        Computed once and cached, so the position must not change after the
+        node has been hashed (e.g. added to a set).
+        """
+        if self._hash is None:
+            self._hash = hash((round(self.x, 6), round(self.y, 6)))
+        return self._hash
     
     def __repr__(self):
         return f"SamplingNode({self.x:.2f}, {self.y:.2f})"
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Regression tests for RRT collision checking.
+"""
+
+import unittest
+
+from src.core import Grid, SamplingNode
+from src.algorithms.sampling.rrt import RRT, RRTConnect
+
+
+class CollisionCheckTest(unittest.TestCase):
+    """Short edges must not cut through blocked cells."""
+    
+    def test_edge_through_blocked_cell_is_rejected(self):
+        grid = Grid(5, 5)
+        grid.set_walkable(2, 1, False)
+        
+        from_node = SamplingNode(1.6, 1.4)
+        to_node = SamplingNode(2.4, 1.6)
+        
+        for planner in (RRT(), RRTConnect()):
+            self.assertFalse(planner._is_collision_free(grid, from_node, to_node))
+    
+    def test_diagonal_corner_cut_is_rejected(self):
+        grid = Grid(5, 5)
+        grid.set_walkable(0, 0, False)
+        
+        from_node = SamplingNode(0.4, 0.6)
+        to_node = SamplingNode(0.6, 0.4)
+        
+        for planner in (RRT(), RRTConnect()):
+            self.assertFalse(planner._is_collision_free(grid, from_node, to_node))
+    
+    def test_open_short_edge_is_accepted(self):
+        grid = Grid(5, 5)
+        
+        from_node = SamplingNode(1.6, 1.4)
+        to_node = SamplingNode(2.4, 1.6)
+        
+        for planner in (RRT(), RRTConnect()):
+            self.assertTrue(planner._is_collision_free(grid, from_node, to_node))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,31 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from array import array
+import base64
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Tuple
+import gzip
+import hashlib
+import multiprocessing
+import threading
 import sys
 import os
 import importlib
+import time
 
 # Add the parent directory to the Python path to import our algorithms
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# Optional C-accelerated JSON encoder, used for responses when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Dynamic imports to handle missing modules gracefully
 def try_import(module_path, class_name):
     """Try to import a class, return None if import fails."""
@@ -16,9 +36,274 @@ def try_import(module_path, class_name):
         print(f"Warning: Could not import {class_name} from {module_path}: {e}")
         return None
 
+# Byte translation table: obstacle cells (1) become 0, everything else 1
+OBSTACLE_TO_WALKABLE = bytes(0 if value == 1 else 1 for value in range(256))
+
+def walkable_mask(grid_data):
+    """Pack rows of cells where 1 marks an obstacle into a row-major walkable mask."""
+    try:
+        # Rows of small ints pack and translate in C, without a per-cell loop
+        return b''.join(map(bytes, grid_data)).translate(OBSTACLE_TO_WALKABLE)
+    except (TypeError, ValueError):
+        # Rows holding anything else (floats, large ints) take the generic path
+        return bytes(cell != 1 for row in grid_data for cell in row)
+
+def parse_position(value, name):
+    """Validate an [x, y] pair of integers from a request body."""
+    if (not isinstance(value, (list, tuple)) or len(value) != 2
+            or not all(type(coordinate) is int for coordinate in value)):
+        raise ValueError(f'{name} must be a pair of integers [x, y]')
+    return value[0], value[1]
+
+# Size limits, checked before any grid data is parsed. Sides are capped so
+# cell coordinates fit in int16; the body cap leaves room for nested JSON rows
+MAX_GRID_SIDE = 32767
+MAX_GRID_CELLS = 1_000_000
+MAX_REQUEST_BYTES = 8 * 1024 * 1024
+
+def packed_walkable_mask(packed, width, height):
+    """Turn a packed grid (one byte per cell, row-major, 1 marks an obstacle) into a walkable mask."""
+    if len(packed) != width * height:
+        raise ValueError(f'Packed grid must hold width * height = {width * height} bytes, got {len(packed)}')
+    return packed.translate(OBSTACLE_TO_WALKABLE)
+
+@dataclass(frozen=True)
+class GridRequest:
+    """Grid, start and goal of a pathfinding request, validated up front."""
+    width: int
+    height: int
+    mask: bytes
+    start: Tuple[int, int]
+    goal: Tuple[int, int]
+    
+    @classmethod
+    def from_data(cls, data, packed=None):
+        """
+        Validate decoded request parameters, raising ValueError if they are malformed.
+        
+        'width' and 'height' are required. The grid is either ``packed``,
+        the raw bytes of a binary request body, 'grid_b64' (a base64 packed
+        grid), or nested 'grid' rows.
+        """
+        if not isinstance(data, dict):
+            raise ValueError('Request body must be a JSON object')
+        
+        # Cheap checks first, so bad or oversized input never reaches the grid parsing
+        start = parse_position(data.get('start', [1, 1]), 'start')
+        goal = parse_position(data.get('goal', [28, 18]), 'goal')
+        
+        width, height = data.get('width'), data.get('height')
+        if type(width) is not int or type(height) is not int or width <= 0 or height <= 0:
+            raise ValueError('width and height must be positive integers')
+        if width > MAX_GRID_SIDE or height > MAX_GRID_SIDE or width * height > MAX_GRID_CELLS:
+            raise ValueError(f'Grids are limited to {MAX_GRID_CELLS} cells and {MAX_GRID_SIDE} cells per side')
+        
+        # Packed grids skip per-cell decoding entirely
+        if packed is None and 'grid_b64' in data:
+            if not isinstance(data['grid_b64'], str):
+                raise ValueError('grid_b64 must be a base64 string')
+            packed = base64.b64decode(data['grid_b64'], validate=True)
+        if packed is not None:
+            mask = packed_walkable_mask(packed, width, height)
+        else:
+            grid_data = data.get('grid')
+            if (not isinstance(grid_data, list) or len(grid_data) != height
+                    or not all(isinstance(row, list) and len(row) == width for row in grid_data)):
+                raise ValueError('grid must be a list of height rows of width cells')
+            
+            mask = walkable_mask(grid_data)
+        
+        return cls(width, height, mask, start, goal)
+    
+    def endpoint_error(self):
+        """Why the start or goal cannot be searched from, or None if both are open cells."""
+        for name, (x, y) in (('Start', self.start), ('Goal', self.goal)):
+            if not (0 <= x < self.width and 0 <= y < self.height):
+                return f"{name} position {(x, y)} is outside grid bounds"
+            if not self.mask[y * self.width + x]:
+                return f"{name} position {(x, y)} is not walkable"
+        return None
+
+# Compact alternative to JSON for large coordinate lists, see pack_search
+BINARY_MIMETYPE = 'application/octet-stream'
+
+def pack_search(path, visited_nodes, open_nodes):
+    """
+    Pack a search's path and explored cells into one binary payload.
+    
+    Layout, all little-endian: three uint32 counts (path, visited, open),
+    the path's (x, y) pairs as float32 since any-angle and sampling paths
+    leave the grid lattice, then the visited and open cells' (x, y) pairs
+    as int16, 4 bytes per cell.
+    """
+    counts = array('I', [len(path), len(visited_nodes), len(open_nodes)])
+    path_coordinates = array('f', [value for point in path for value in point])
+    cell_coordinates = array('h', [value for cells in (visited_nodes, open_nodes) for cell in cells for value in cell])
+    if sys.byteorder == 'big':
+        counts.byteswap()
+        path_coordinates.byteswap()
+        cell_coordinates.byteswap()
+    return counts.tobytes() + path_coordinates.tobytes() + cell_coordinates.tobytes()
+
+def wants_binary():
+    """Whether the client prefers the packed binary format over JSON."""
+    return request.accept_mimetypes.best_match(['application/json', BINARY_MIMETYPE]) == BINARY_MIMETYPE
+
+# Idle grids by (width, height), reused across requests instead of reallocated.
+# Only the most recently used sizes are kept, so clients can't grow the pool
+GRID_POOL_SIZE = 4
+GRID_POOL_SHAPES = 8
+grid_pool = OrderedDict()
+grid_pool_lock = threading.Lock()
+
+def acquire_grid(width, height, mask):
+    """Take a pooled grid of this size, or a new one, loaded with the walkable mask."""
+    with grid_pool_lock:
+        pooled = grid_pool.get((width, height))
+        grid = pooled.pop() if pooled else None
+    
+    if grid is None:
+        return Grid.from_walkable_bytes(width, height, mask)
+    grid.load_walkable_bytes(mask)
+    return grid
+
+def release_grid(grid):
+    """Return a grid to the pool once a request is done with it."""
+    # Drop the nodes created by the search; only the mask is worth keeping
+    grid._initialize_grid()
+    
+    key = (grid.width, grid.height)
+    with grid_pool_lock:
+        pooled = grid_pool.setdefault(key, [])
+        grid_pool.move_to_end(key)
+        if len(pooled) < GRID_POOL_SIZE:
+            pooled.append(grid)
+        while len(grid_pool) > GRID_POOL_SHAPES:
+            grid_pool.popitem(last=False)
+
+def read_json_body():
+    """Decode the request body in a single pass, or return None if it is not valid JSON."""
+    try:
+        return app.json.loads(request.get_data(cache=False))
+    except ValueError:
+        return None
+
+def parse_int_list(value):
+    """Parse a comma-separated query string value such as '3,4'."""
+    return [int(part) for part in value.split(',')]
+
+def read_request():
+    """
+    Decode the request into a parameter dict and a packed grid, if one was sent.
+    
+    JSON bodies are decoded as-is. A packed grid body sent as
+    application/octet-stream takes its size from the X-Grid-Width and
+    X-Grid-Height headers and everything else from the query string,
+    e.g. ?algorithm=astar&start=1,1&goal=28,18.
+    """
+    if request.mimetype != BINARY_MIMETYPE:
+        return read_json_body(), None
+    
+    data = {
+        'width': request.headers.get('X-Grid-Width', type=int),
+        'height': request.headers.get('X-Grid-Height', type=int),
+    }
+    for key in ('start', 'goal'):
+        if key in request.args:
+            data[key] = request.args.get(key, type=parse_int_list)
+    if 'algorithm' in request.args:
+        data['algorithm'] = request.args['algorithm']
+    if 'algorithms' in request.args:
+        data['algorithms'] = request.args['algorithms'].split(',')
+    return data, request.get_data(cache=False)
+
+# Algorithm instances per thread, reused across requests
+algorithm_instances = threading.local()
+
+def get_algorithm(algorithm_name):
+    """Return this thread's instance of an algorithm, reset for a new search."""
+    instances = getattr(algorithm_instances, 'by_name', None)
+    if instances is None:
+        instances = algorithm_instances.by_name = {}
+    
+    algorithm = instances.get(algorithm_name)
+    if algorithm is None:
+        algorithm = instances[algorithm_name] = ALGORITHMS[algorithm_name]()
+    else:
+        algorithm.reset()
+    return algorithm
+
+# Cumulative find_path timings per algorithm, served by /api/metrics
+search_counts = Counter()
+search_seconds = Counter()
+metrics_lock = threading.Lock()
+
+def record_search(algorithm_name, seconds):
+    """Add one search's duration to the metrics."""
+    with metrics_lock:
+        search_counts[algorithm_name] += 1
+        search_seconds[algorithm_name] += seconds
+
+@contextmanager
+def timed_search(algorithm_name):
+    """Record the duration of the enclosed find_path call, even if it raises."""
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_search(algorithm_name, time.perf_counter() - start_time)
+
+# Recently served run_algorithm response bodies, least recently used first
+RESULT_CACHE_SIZE = 256
+# Sampling-based results differ from run to run, so they are never cached
+UNCACHED_ALGORITHMS = {'rrt'}
+result_cache = OrderedDict()
+result_cache_lock = threading.Lock()
+
+def cached_result(key):
+    """Return the cached response body for key, or None."""
+    with result_cache_lock:
+        body = result_cache.get(key)
+        if body is not None:
+            result_cache.move_to_end(key)
+        return body
+
+def cache_result(key, body):
+    """Store a response body, evicting the least recently used beyond RESULT_CACHE_SIZE."""
+    with result_cache_lock:
+        result_cache[key] = body
+        result_cache.move_to_end(key)
+        if len(result_cache) > RESULT_CACHE_SIZE:
+            result_cache.popitem(last=False)
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Compact, unsorted JSON, encoded and decoded with orjson when it is installed."""
+    compact = True
+    sort_keys = False
+    
+    def dumps(self, obj, **kwargs):
+        if orjson is None or 'indent' in kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=kwargs.get('default', self.default)).decode()
+    
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
+# Werkzeug also stops reading bodies that arrive without a Content-Length at this size
+app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_BYTES
 
-# Try to import all algorithm classes
+@app.before_request
+def limit_request_size():
+    """Refuse oversized bodies by their Content-Length, before any handler reads them."""
+    if request.content_length is not None and request.content_length > MAX_REQUEST_BYTES:
+        return jsonify({'error': f'Request body is limited to {MAX_REQUEST_BYTES} bytes'}), 413
+
+# Try to import the grid and all algorithm classes once, at startup
+Grid = try_import('src.core.grid', 'Grid')
 AStar = try_import('src.algorithms.classical.astar', 'AStar')
 WeightedAStar = try_import('src.algorithms.classical.weighted_astar', 'WeightedAStar')
 Dijkstra = try_import('src.algorithms.classical.dijkstra', 'Dijkstra')
@@ -44,267 +329,417 @@ if IDAStar:
 if RRT:
     ALGORITHMS['rrt'] = RRT
 
+# Responses worth compressing: coordinate lists repeat heavily and shrink well
+COMPRESS_MIMETYPES = {'application/json', BINARY_MIMETYPE}
+COMPRESS_MIN_SIZE = 1024
+
+@app.after_request
+def compress_response(response):
+    """Gzip large API responses for clients that accept it."""
+    if (response.mimetype not in COMPRESS_MIMETYPES
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.accept_encodings):
+        return response
+    
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(body, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
 @app.route('/')
 def index():
     """Serve the main visualization page."""
     return render_template('index.html')
 
+def search_response(path, visited_nodes, open_nodes, binary):
+    """Build the run_algorithm response for a finished search."""
+    # Large searches serialize much smaller as packed binary than as JSON
+    if binary:
+        return Response(pack_search(path or [], visited_nodes, open_nodes), mimetype=BINARY_MIMETYPE)
+    
+    # Prepare response
+    result = {
+        'success': True,
+        'path': path if path else [],
+        'visited_nodes': visited_nodes,
+        'open_nodes': open_nodes,
+        'stats': {
+            'path_length': len(path) if path else 0,
+            'nodes_visited': len(visited_nodes),
+            'nodes_in_open': len(open_nodes)
+        }
+    }
+    return jsonify(result)
+
 @app.route('/api/run_algorithm', methods=['POST'])
 def run_algorithm():
     """Run a pathfinding algorithm and return the results."""
     try:
         # Check if Grid class is available
-        Grid = try_import('src.core.grid', 'Grid')
         if not Grid:
             return jsonify({'error': 'Grid class not available'}), 500
         
-        data = request.get_json()
+        data, packed = read_request()
         
-        # Extract parameters
-        algorithm_name = data.get('algorithm', 'astar')
-        grid_data = data.get('grid', [])
-        start_pos = tuple(data.get('start', [1, 1]))
-        goal_pos = tuple(data.get('goal', [28, 18]))
+        # Extract and validate parameters
+        try:
+            params = GridRequest.from_data(data, packed)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        width, height, mask = params.width, params.height, params.mask
+        start_pos, goal_pos = params.start, params.goal
         
         # Validate algorithm
-        if algorithm_name not in ALGORITHMS:
+        algorithm_name = data.get('algorithm', 'astar')
+        if not isinstance(algorithm_name, str) or algorithm_name not in ALGORITHMS:
             return jsonify({'error': f'Unknown algorithm: {algorithm_name}. Available: {list(ALGORITHMS.keys())}'}), 400
         
-        # Create grid from data
-        height = len(grid_data)
-        width = len(grid_data[0]) if height > 0 else 0
-        
-        if width == 0 or height == 0:
-            return jsonify({'error': 'Invalid grid data'}), 400
+        # Trivial requests are answered without dispatching to an algorithm
+        error = params.endpoint_error()
+        if error:
+            return jsonify({'error': error}), 400
         
-        grid = Grid(width, height)
+        binary = wants_binary()
+        if start_pos == goal_pos:
+            return search_response([start_pos], [], [], binary)
         
-        # Set obstacles
-        for y in range(height):
-            for x in range(width):
-                if grid_data[y][x] == 1:  # 1 represents obstacle
-                    grid.set_obstacle(x, y)
+        # Identical queries on an identical grid reuse the serialized response
+        mimetype = BINARY_MIMETYPE if binary else 'application/json'
+        cache_key = None
+        if algorithm_name not in UNCACHED_ALGORITHMS:
+            grid_hash = hashlib.blake2b(mask, digest_size=16).digest()
+            cache_key = (grid_hash, width, start_pos, goal_pos, algorithm_name, binary)
+            body = cached_result(cache_key)
+            if body is not None:
+                return Response(body, mimetype=mimetype)
         
-        # Get algorithm class and create instance
-        algorithm_class = ALGORITHMS[algorithm_name]
-        algorithm = algorithm_class()
-        
-        # Run pathfinding
-        path = algorithm.find_path(grid, start_pos, goal_pos)
+        grid = acquire_grid(width, height, mask)
+        try:
+            # Reuse this thread's algorithm instance
+            algorithm = get_algorithm(algorithm_name)
+            
+            # Run pathfinding
+            with timed_search(algorithm_name):
+                path = algorithm.find_path(grid, start_pos, goal_pos).path
+        finally:
+            release_grid(grid)
         
         # Get additional information
         visited_nodes = getattr(algorithm, 'visited_nodes', [])
         open_nodes = getattr(algorithm, 'open_nodes', [])
         
-        # Prepare response
-        result = {
-            'success': True,
-            'path': path if path else [],
-            'visited_nodes': visited_nodes,
-            'open_nodes': open_nodes,
-            'stats': {
-                'path_length': len(path) if path else 0,
-                'nodes_visited': len(visited_nodes),
-                'nodes_in_open': len(open_nodes)
-            }
-        }
+        response = search_response(path, visited_nodes, open_nodes, binary)
+        if cache_key is not None:
+            cache_result(cache_key, response.get_data())
         
-        return jsonify(result)
+        return response
         
     except Exception as e:
+        app.logger.exception("run_algorithm failed")
         return jsonify({'error': str(e)}), 500
 
+# Worker processes for compare_algorithms, created on first use
+compare_executor = None
+compare_executor_lock = threading.Lock()
+
+def server_worker_count():
+    """Server processes sharing this machine, as gunicorn's WEB_CONCURRENCY reports."""
+    try:
+        return max(1, int(os.environ.get('WEB_CONCURRENCY', 1)))
+    except ValueError:
+        return 1
+
+def get_compare_executor():
+    """Return the shared compare worker pool, starting it if needed."""
+    global compare_executor
+    with compare_executor_lock:
+        if compare_executor is None:
+            # Split the cores between server processes instead of giving each
+            # one a full pool, and start workers fresh rather than forking a
+            # multi-threaded server process
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            max_workers = max(1, (os.cpu_count() or 1) // server_worker_count())
+            compare_executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+        return compare_executor
+
+def discard_compare_executor(executor):
+    """Drop a broken compare pool so the next use starts a fresh one."""
+    global compare_executor
+    with compare_executor_lock:
+        if compare_executor is executor:
+            compare_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def submit_comparisons(names, width, height, mask, start_pos, goal_pos):
+    """
+    Submit one compare_one call per algorithm, replacing the pool once if it is broken.
+    
+    Returns the pool used and the futures by algorithm name.
+    """
+    executor = get_compare_executor()
+    try:
+        return executor, {name: executor.submit(compare_one, name, width, height, mask, start_pos, goal_pos)
+                          for name in names}
+    except BrokenProcessPool:
+        # A worker died during an earlier request
+        discard_compare_executor(executor)
+        executor = get_compare_executor()
+        return executor, {name: executor.submit(compare_one, name, width, height, mask, start_pos, goal_pos)
+                          for name in names}
+
+def comparison_result(algorithm_name, path, execution_time, visited_nodes, open_nodes):
+    """Summarize one algorithm's search for compare_algorithms; execution_time is in milliseconds."""
+    return {
+        'success': True,
+        'path': path if path else [],
+        'execution_time': execution_time,
+        'stats': {
+            'path_length': len(path) if path else 0,
+            'nodes_visited': len(visited_nodes),
+            'nodes_in_open': len(open_nodes),
+            'optimal': algorithm_name in ['astar', 'dijkstra', 'theta_star', 'ida_star']
+        }
+    }
+
+def compare_one(algorithm_name, width, height, mask, start_pos, goal_pos):
+    """Run one algorithm of a comparison; executes in a compare worker process."""
+    # Fresh walkability for each algorithm, on a pooled grid
+    grid = acquire_grid(width, height, mask)
+    try:
+        # Reuse this thread's algorithm instance
+        algorithm = get_algorithm(algorithm_name)
+        
+        # Measure execution time
+        start_time = time.perf_counter()
+        path = algorithm.find_path(grid, start_pos, goal_pos).path
+        end_time = time.perf_counter()
+        
+        # Get additional information
+        visited_nodes = getattr(algorithm, 'visited_nodes', [])
+        open_nodes = getattr(algorithm, 'open_nodes', [])
+        
+        return comparison_result(algorithm_name, path, (end_time - start_time) * 1000,
+                                 visited_nodes, open_nodes)
+        
+    except Exception as e:
+        app.logger.exception("compare_algorithms: %s failed", algorithm_name)
+        return {'error': str(e)}
+    finally:
+        release_grid(grid)
+
 @app.route('/api/compare_algorithms', methods=['POST'])
 def compare_algorithms():
     """Compare multiple algorithms on the same grid."""
     try:
         # Check if Grid class is available
-        Grid = try_import('src.core.grid', 'Grid')
         if not Grid:
             return jsonify({'error': 'Grid class not available'}), 500
         
-        data = request.get_json()
+        data, packed = read_request()
+        
+        # Extract and validate parameters; the obstacles are parsed once and
+        # each algorithm gets a copy of the same mask
+        try:
+            params = GridRequest.from_data(data, packed)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        width, height, mask = params.width, params.height, params.mask
+        start_pos, goal_pos = params.start, params.goal
         
-        # Extract parameters
         algorithms = data.get('algorithms', ['astar', 'dijkstra'])
-        grid_data = data.get('grid', [])
-        start_pos = tuple(data.get('start', [1, 1]))
-        goal_pos = tuple(data.get('goal', [28, 18]))
+        if not isinstance(algorithms, list) or not all(isinstance(name, str) for name in algorithms):
+            return jsonify({'error': 'algorithms must be a list of algorithm names'}), 400
         
-        results = {}
+        # Trivial requests are answered without dispatching to any algorithm
+        error = params.endpoint_error()
+        if error:
+            return jsonify({'error': error}), 400
         
-        # Create grid from data
-        height = len(grid_data)
-        width = len(grid_data[0]) if height > 0 else 0
+        if start_pos == goal_pos:
+            return jsonify({
+                name: comparison_result(name, [start_pos], 0.0, [], []) if name in ALGORITHMS
+                else {'error': 'Unknown algorithm'}
+                for name in algorithms
+            })
         
-        if width == 0 or height == 0:
-            return jsonify({'error': 'Invalid grid data'}), 400
+        # Algorithms are independent over the same grid, so run them side by side
+        known = [name for name in algorithms if name in ALGORITHMS]
+        if len(known) > 1:
+            executor, futures = submit_comparisons(known, width, height, mask, start_pos, goal_pos)
+        else:
+            executor, futures = None, {}
         
+        results = {}
         for algorithm_name in algorithms:
             if algorithm_name not in ALGORITHMS:
                 results[algorithm_name] = {'error': 'Unknown algorithm'}
-                continue
+            elif algorithm_name in futures:
+                try:
+                    results[algorithm_name] = futures[algorithm_name].result()
+                except BrokenProcessPool as e:
+                    # A worker died mid-search; later requests get a fresh pool
+                    app.logger.exception("compare_algorithms: worker pool broke running %s", algorithm_name)
+                    discard_compare_executor(executor)
+                    results[algorithm_name] = {'error': str(e)}
+                except Exception as e:
+                    app.logger.exception("compare_algorithms: %s worker failed", algorithm_name)
+                    results[algorithm_name] = {'error': str(e)}
+            else:
+                results[algorithm_name] = compare_one(algorithm_name, width, height, mask, start_pos, goal_pos)
             
-            try:
-                # Create fresh grid for each algorithm
-                grid = Grid(width, height)
-                
-                # Set obstacles
-                for y in range(height):
-                    for x in range(width):
-                        if grid_data[y][x] == 1:  # 1 represents obstacle
-                            grid.set_obstacle(x, y)
-                
-                # Get algorithm class and create instance
-                algorithm_class = ALGORITHMS[algorithm_name]
-                algorithm = algorithm_class()
-                
-                # Measure execution time
-                import time
-                start_time = time.perf_counter()
-                path = algorithm.find_path(grid, start_pos, goal_pos)
-                end_time = time.perf_counter()
-                
-                # Get additional information
-                visited_nodes = getattr(algorithm, 'visited_nodes', [])
-                open_nodes = getattr(algorithm, 'open_nodes', [])
-                
-                results[algorithm_name] = {
-                    'success': True,
-                    'path': path if path else [],
-                    'execution_time': (end_time - start_time) * 1000,  # Convert to milliseconds
-                    'stats': {
-                        'path_length': len(path) if path else 0,
-                        'nodes_visited': len(visited_nodes),
-                        'nodes_in_open': len(open_nodes),
-                        'optimal': algorithm_name in ['astar', 'dijkstra', 'theta_star', 'ida_star']
-                    }
-                }
-                
-            except Exception as e:
-                results[algorithm_name] = {'error': str(e)}
+            # Searches ran in worker processes, so record their timings here
+            if 'execution_time' in results[algorithm_name]:
+                record_search(algorithm_name, results[algorithm_name]['execution_time'] / 1000)
         
         return jsonify(results)
         
     except Exception as e:
+        app.logger.exception("compare_algorithms failed")
         return jsonify({'error': str(e)}), 500
 
+# Static algorithm info, serialized once at startup since it never changes
+ALGORITHM_DESCRIPTIONS = {
+    'astar': {
+        'name': 'A*',
+        'description': 'A* is a best-first search algorithm that uses both actual distance from start and estimated distance to goal. Guarantees shortest path with admissible heuristic.',
+        'complexity': 'O(b^d)',
+        'optimal': True,
+        'complete': True,
+        'heuristic': 'Manhattan/Euclidean',
+        'memory_usage': 'High',
+        'characteristics': [
+            'Uses both g-cost (actual) and h-cost (heuristic)',
+            'Maintains open and closed lists',
+            'Guarantees optimal path with admissible heuristic',
+            'Most popular pathfinding algorithm'
+        ]
+    },
+    'weighted_astar': {
+        'name': 'Weighted A*',
+        'description': 'Weighted A* trades optimality for speed by inflating the heuristic. Finds paths faster but may not be optimal.',
+        'complexity': 'O(b^d)',
+        'optimal': False,
+        'complete': True,
+        'heuristic': 'Weighted Euclidean',
+        'memory_usage': 'High',
+        'characteristics': [
+            'Uses inflated heuristic (weight > 1.0)',
+            'Faster than standard A*',
+            'Path quality bounded by weight factor',
+            'Good for real-time applications'
+        ]
+    },
+    'dijkstra': {
+        'name': 'Dijkstra\'s Algorithm',
+        'description': 'Dijkstra\'s algorithm explores uniformly in all directions, guaranteeing the shortest path. No heuristic used.',
+        'complexity': 'O(V²) or O((V+E)logV)',
+        'optimal': True,
+        'complete': True,
+        'heuristic': 'None',
+        'memory_usage': 'High',
+        'characteristics': [
+            'No heuristic guidance',
+            'Explores uniformly in all directions',
+            'Always finds optimal path',
+            'Slower than A* but more thorough'
+        ]
+    },
+    'theta_star': {
+        'name': 'Theta*',
+        'description': 'Theta* allows any-angle paths by checking line-of-sight, creating more natural looking paths than grid-constrained algorithms.',
+        'complexity': 'O(b^d)',
+        'optimal': True,
+        'complete': True,
+        'heuristic': 'Euclidean',
+        'memory_usage': 'High',
+        'characteristics': [
+            'Any-angle pathfinding',
+            'Line-of-sight optimization',
+            'More natural, smoother paths',
+            'Higher computational cost per node'
+        ]
+    },
+    'jps': {
+        'name': 'Jump Point Search',
+        'description': 'Jump Point Search dramatically speeds up A* on uniform-cost grids by jumping over intermediate nodes.',
+        'complexity': 'O(b^d) but with much smaller branching factor',
+        'optimal': True,
+        'complete': True,
+        'heuristic': 'Manhattan',
+        'memory_usage': 'Medium',
+        'characteristics': [
+            'Dramatic speedup over A*',
+            'Works best on uniform-cost grids',
+            'Prunes symmetric paths',
+            'Maintains optimality guarantee'
+        ]
+    },
+    'ida_star': {
+        'name': 'Iterative Deepening A*',
+        'description': 'Iterative Deepening A* uses less memory than A* by performing depth-limited searches with increasing thresholds.',
+        'complexity': 'O(b^d)',
+        'optimal': True,
+        'complete': True,
+        'heuristic': 'Manhattan/Euclidean',
+        'memory_usage': 'Low',
+        'characteristics': [
+            'Linear memory usage',
+            'Iterative threshold increases',
+            'Good for memory-constrained environments',
+            'May revisit nodes multiple times'
+        ]
+    },
+    'rrt': {
+        'name': 'Rapidly-exploring Random Tree',
+        'description': 'Rapidly-exploring Random Tree builds a tree by random sampling, good for complex environments but paths may be suboptimal.',
+        'complexity': 'O(n log n)',
+        'optimal': False,
+        'complete': True,
+        'heuristic': 'None (sampling-based)',
+        'memory_usage': 'Variable',
+        'characteristics': [
+            'Probabilistically complete',
+            'Good for high-dimensional spaces',
+            'Random sampling approach',
+            'Paths are typically not optimal'
+        ]
+    }
+}
+
+ALGORITHM_INFO_JSON = {name: app.json.dumps(info) for name, info in ALGORITHM_DESCRIPTIONS.items()}
+
 @app.route('/api/algorithm_info/<algorithm_name>')
 def get_algorithm_info(algorithm_name):
     """Get information about a specific algorithm."""
-    
-    algorithm_descriptions = {
-        'astar': {
-            'name': 'A*',
-            'description': 'A* is a best-first search algorithm that uses both actual distance from start and estimated distance to goal. Guarantees shortest path with admissible heuristic.',
-            'complexity': 'O(b^d)',
-            'optimal': True,
-            'complete': True,
-            'heuristic': 'Manhattan/Euclidean',
-            'memory_usage': 'High',
-            'characteristics': [
-                'Uses both g-cost (actual) and h-cost (heuristic)',
-                'Maintains open and closed lists',
-                'Guarantees optimal path with admissible heuristic',
-                'Most popular pathfinding algorithm'
-            ]
-        },
-        'weighted_astar': {
-            'name': 'Weighted A*',
-            'description': 'Weighted A* trades optimality for speed by inflating the heuristic. Finds paths faster but may not be optimal.',
-            'complexity': 'O(b^d)',
-            'optimal': False,
-            'complete': True,
-            'heuristic': 'Weighted Euclidean',
-            'memory_usage': 'High',
-            'characteristics': [
-                'Uses inflated heuristic (weight > 1.0)',
-                'Faster than standard A*',
-                'Path quality bounded by weight factor',
-                'Good for real-time applications'
-            ]
-        },
-        'dijkstra': {
-            'name': 'Dijkstra\'s Algorithm',
-            'description': 'Dijkstra\'s algorithm explores uniformly in all directions, guaranteeing the shortest path. No heuristic used.',
-            'complexity': 'O(V²) or O((V+E)logV)',
-            'optimal': True,
-            'complete': True,
-            'heuristic': 'None',
-            'memory_usage': 'High',
-            'characteristics': [
-                'No heuristic guidance',
-                'Explores uniformly in all directions',
-                'Always finds optimal path',
-                'Slower than A* but more thorough'
-            ]
-        },
-        'theta_star': {
-            'name': 'Theta*',
-            'description': 'Theta* allows any-angle paths by checking line-of-sight, creating more natural looking paths than grid-constrained algorithms.',
-            'complexity': 'O(b^d)',
-            'optimal': True,
-            'complete': True,
-            'heuristic': 'Euclidean',
-            'memory_usage': 'High',
-            'characteristics': [
-                'Any-angle pathfinding',
-                'Line-of-sight optimization',
-                'More natural, smoother paths',
-                'Higher computational cost per node'
-            ]
-        },
-        'jps': {
-            'name': 'Jump Point Search',
-            'description': 'Jump Point Search dramatically speeds up A* on uniform-cost grids by jumping over intermediate nodes.',
-            'complexity': 'O(b^d) but with much smaller branching factor',
-            'optimal': True,
-            'complete': True,
-            'heuristic': 'Manhattan',
-            'memory_usage': 'Medium',
-            'characteristics': [
-                'Dramatic speedup over A*',
-                'Works best on uniform-cost grids',
-                'Prunes symmetric paths',
-                'Maintains optimality guarantee'
-            ]
-        },
-        'ida_star': {
-            'name': 'Iterative Deepening A*',
-            'description': 'Iterative Deepening A* uses less memory than A* by performing depth-limited searches with increasing thresholds.',
-            'complexity': 'O(b^d)',
-            'optimal': True,
-            'complete': True,
-            'heuristic': 'Manhattan/Euclidean',
-            'memory_usage': 'Low',
-            'characteristics': [
-                'Linear memory usage',
-                'Iterative threshold increases',
-                'Good for memory-constrained environments',
-                'May revisit nodes multiple times'
-            ]
-        },
-        'rrt': {
-            'name': 'Rapidly-exploring Random Tree',
-            'description': 'Rapidly-exploring Random Tree builds a tree by random sampling, good for complex environments but paths may be suboptimal.',
-            'complexity': 'O(n log n)',
-            'optimal': False,
-            'complete': True,
-            'heuristic': 'None (sampling-based)',
-            'memory_usage': 'Variable',
-            'characteristics': [
-                'Probabilistically complete',
-                'Good for high-dimensional spaces',
-                'Random sampling approach',
-                'Paths are typically not optimal'
-            ]
-        }
-    }
-    
-    if algorithm_name not in algorithm_descriptions:
+    if algorithm_name not in ALGORITHM_INFO_JSON:
         return jsonify({'error': 'Unknown algorithm'}), 404
     
-    return jsonify(algorithm_descriptions[algorithm_name])
+    response = Response(ALGORITHM_INFO_JSON[algorithm_name], mimetype='application/json')
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
+
+@app.route('/api/metrics')
+def get_metrics():
+    """Search timings per algorithm since this worker process started."""
+    with metrics_lock:
+        metrics = {
+            name: {
+                'searches': count,
+                'total_ms': search_seconds[name] * 1000,
+                'mean_ms': search_seconds[name] * 1000 / count
+            }
+            for name, count in search_counts.items()
+        }
+    return jsonify(metrics)
 
 @app.errorhandler(404)
 def not_found(error):
@@ -314,10 +749,34 @@ def not_found(error):
 def internal_error(error):
     return jsonify({'error': 'Internal server error'}), 500
 
+def serve(host, port):
+    """Serve the app with one gunicorn worker per core, or threaded Werkzeug without gunicorn."""
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        # Threads rather than forked processes, so the result cache and
+        # grid pool survive between requests
+        print("gunicorn not installed, falling back to the threaded Werkzeug server")
+        app.run(host=host, port=port, threaded=True)
+        return
+    
+    # Published so each worker sizes its compare pool to its share of the cores
+    workers = int(os.environ.setdefault('WEB_CONCURRENCY', str(os.cpu_count() or 1)))
+    
+    class StandaloneApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f'{host}:{port}')
+            self.cfg.set('workers', workers)
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('threads', 2)
+        
+        def load(self):
+            return app
+    
+    StandaloneApplication().run()
+
 if __name__ == '__main__':
     # Check if we can import our core framework
-    Grid = try_import('src.core.grid', 'Grid')
-    
     if not Grid:
         print("Failed to import core Grid class")
         print("Make sure you're running from the project root directory")
@@ -335,4 +794,8 @@ if __name__ == '__main__':
     print("\nStarting Pathfinding Algorithm Visualizer...")
     print("Open your browser to: http://127.0.0.1:5000")
     
-    app.run(debug=True, host='127.0.0.1', port=5000)
\ No newline at end of file
+    # --dev keeps Flask's single-process debug server with the reloader
+    if '--dev' in sys.argv:
+        app.run(debug=True, host='127.0.0.1', port=5000)
+    else:
+        serve('127.0.0.1', 5000)
\ No newline at end of file